@@ -8,7 +8,7 @@ AI 服务 - 统一的 AI 功能入口
 """
 from typing import Optional
 
-from src.common import Logger
+from src.common import get_logger
 from .ai_config import AIConfig
 from .vision_analyzer import VisionAnalyzer
 
@@ -33,7 +33,7 @@ class AIService:
             config: AI 配置对象
         """
         self.config = config
-        self.logger = Logger(config.log_dir)
+        self.logger = get_logger(config.log_dir)
 
         # Vision 分析器（延迟初始化）
         self._vision_analyzer: Optional[VisionAnalyzer] = None
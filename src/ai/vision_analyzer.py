@@ -10,7 +10,7 @@ import time
 
 import httpx
 
-from src.common import Logger
+from src.common import get_logger
 
 
 class VisionAnalyzer:
@@ -45,7 +45,7 @@ class VisionAnalyzer:
         self.model = model
         self.timeout = timeout
         self.max_retries = max_retries
-        self.logger = Logger(log_dir)
+        self.logger = get_logger(log_dir)
         self.project_root = project_root or Path(__file__).parent.parent.parent
 
     def analyze(self, image_path: str) -> Dict[str, Any]:
@@ -3,6 +3,8 @@
 """
 import os
 import json
+from functools import lru_cache
+from typing import Optional
 from pathlib import Path
 from datetime import datetime
 from dotenv import load_dotenv
@@ -15,14 +17,67 @@ BASE_DIR = Path(__file__).parent.parent
 load_dotenv(os.path.join(BASE_DIR, '.env'))
 
 
+# ==================== JSON 序列化 ====================
+
+# 优先使用 orjson（C 实现，速度快很多），未安装时回退到标准库
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_dumps(obj) -> str:
+    """序列化为 JSON 字符串（保留中文，不转义为 \\uXXXX）"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            # orjson 不支持的类型（如超过 64 位的整数），交给标准库处理
+            pass
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def json_dumps_pretty(obj) -> bytes:
+    """序列化为缩进 2 格的 UTF-8 JSON（用于写配置文件）"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def json_loads(data):
+    """解析 JSON（支持 str 和 UTF-8 bytes）"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# 日志级别（数值越大越重要），未知级别按 info 处理
+_LOG_LEVELS = {"debug": 10, "info": 20, "warning": 30, "error": 40}
+
+
 class Logger:
     """简单日志工具"""
 
-    def __init__(self, log_dir):
+    def __init__(self, log_dir, level: Optional[str] = None):
+        """
+        Args:
+            log_dir: 日志目录
+            level: 最低输出级别，默认读取环境变量 LOG_LEVEL（默认 info）
+        """
         self.log_dir = Path(log_dir)
+        level = (level or os.getenv("LOG_LEVEL", "info")).lower()
+        self.level = _LOG_LEVELS.get(level, 20)
+        # 热路径上可以先判断该属性，跳过消息格式化
+        self.info_enabled = self.level <= 20
 
     def log(self, module: str, level: str, message: str, **kwargs):
         """记录日志"""
+        if _LOG_LEVELS.get(level, 20) < self.level:
+            return
+
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         log_entry = {
             "timestamp": timestamp,
@@ -46,6 +101,20 @@ class Logger:
                 print(f"写入日志失败: {e}")
 
 
+@lru_cache(maxsize=8)
+def _get_logger(log_dir: str) -> Logger:
+    return Logger(log_dir)
+
+
+def get_logger(log_dir) -> Logger:
+    """获取共享的 Logger 实例（同一个日志目录只创建一次）
+
+    Args:
+        log_dir: 日志目录（str 或 Path）
+    """
+    return _get_logger(str(log_dir))
+
+
 @dataclass
 class KimiConfig:
     """Kimi Vision API 配置"""
@@ -62,6 +131,8 @@ class CameraConfig:
     camera_index: int = 0
     resolution: tuple = (1920, 1080)  # 目标分辨率
     quality: int = 85  # JPEG 质量
+    drain_frames: int = 2  # 截图前丢弃的缓冲帧数（后端支持 BUFFERSIZE=1 时可设为 0）
+    fourcc: str = ""  # 采集格式，例如 MJPG（留空使用摄像头默认格式）
 
 
 @dataclass
@@ -105,7 +176,9 @@ class Config:
             capture_interval=int(os.getenv("CAPTURE_INTERVAL", "60")),
             camera_index=int(os.getenv("CAMERA_INDEX", "0")),
             resolution=tuple(map(int, os.getenv("RESOLUTION", "1920,1080").split(","))),
-            quality=int(os.getenv("IMAGE_QUALITY", "85"))
+            quality=int(os.getenv("IMAGE_QUALITY", "85")),
+            drain_frames=int(os.getenv("CAMERA_DRAIN_FRAMES", "2")),
+            fourcc=os.getenv("CAMERA_FOURCC", "")
         )
 
         # 企业微信配置
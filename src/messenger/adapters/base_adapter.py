@@ -5,7 +5,7 @@
 """
 from abc import ABC, abstractmethod
 from typing import List, Optional, Callable
-from src.common import Logger
+from src.common import get_logger
 
 from ..models.message import Message, MessageType
 
@@ -28,7 +28,7 @@ class MessageAdapter(ABC):
             log_dir: 日志目录
         """
         self.platform_name = platform_name
-        self.logger = Logger(log_dir)
+        self.logger = get_logger(log_dir)
 
     # ==================== 发送消息 ====================
 
@@ -73,6 +73,24 @@ class MessageAdapter(ABC):
         self.logger.log("messenger", "warning", f"{self.platform_name} 不支持发送图片")
         return False
 
+    def send_text_with_image(self, content: str, image_path: str, recipient_id: str) -> bool:
+        """发送文本 + 图片（可选实现）
+
+        支持图文合并的平台可以覆盖此方法，用一次请求发送两部分内容
+
+        Args:
+            content: 文本内容
+            image_path: 图片路径
+            recipient_id: 接收者 ID
+
+        Returns:
+            是否有任意一部分发送成功
+        """
+        # 默认实现：先发文本，再发图片（无论文本是否成功都尝试发送图片）
+        text_success = self.send_text(content, recipient_id)
+        image_success = self.send_image(image_path, recipient_id)
+        return text_success or image_success
+
     def send_file(self, file_path: str, recipient_id: str) -> bool:
         """发送文件消息（可选实现）
 
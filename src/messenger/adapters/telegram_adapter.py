@@ -10,6 +10,9 @@ import httpx
 from .base_adapter import MessageAdapter
 from ..models.message import MessageType
 
+# Telegram sendPhoto 的 caption 长度上限
+TELEGRAM_CAPTION_LIMIT = 1024
+
 
 class TelegramAdapter(MessageAdapter):
     """Telegram 适配器
@@ -120,6 +123,17 @@ class TelegramAdapter(MessageAdapter):
 
     def send_image(self, image_path: str, recipient_id: str) -> bool:
         """发送图片消息"""
+        return self._send_photo(image_path, recipient_id)
+
+    def send_text_with_image(self, content: str, image_path: str, recipient_id: str) -> bool:
+        """发送文本 + 图片（文本作为图片说明，一次请求发送）"""
+        # Telegram 图片说明最长 1024 字符，超出时分开发送
+        if len(content) > TELEGRAM_CAPTION_LIMIT:
+            return super().send_text_with_image(content, image_path, recipient_id)
+        return self._send_photo(image_path, recipient_id, caption=content)
+
+    def _send_photo(self, image_path: str, recipient_id: str, caption: Optional[str] = None) -> bool:
+        """调用 sendPhoto 发送图片（可附带说明文字）"""
         from pathlib import Path
 
         if not Path(image_path).exists():
@@ -138,6 +152,8 @@ class TelegramAdapter(MessageAdapter):
             with open(image_path, "rb") as f:
                 files = {"photo": (Path(image_path).name, f)}
                 data = {"chat_id": recipient_id}
+                if caption:
+                    data["caption"] = caption
 
                 response = httpx.post(url, data=data, files=files, timeout=60)
                 result = response.json()
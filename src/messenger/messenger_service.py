@@ -9,6 +9,7 @@ Messenger 服务类
 ├─────────────────────────────────────┤
 │     MessengerService (业务层)       │  ← 业务逻辑协调
 │     - send()                        │
+│     - send_with_image()             │
 │     - broadcast()                   │
 │     - on_message()                  │
 ├─────────────────────────────────────┤
@@ -25,7 +26,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Callable, Dict, Any
 from pathlib import Path
 
-from src.common import Logger
+from src.common import get_logger
 from .adapters import MessageAdapter, WeChatAdapter, TelegramAdapter
 from .models import Message, MessageType, MessageLevel
 
@@ -87,7 +88,7 @@ class MessengerService:
             config: 服务配置对象
         """
         self.config = config or MessengerConfig()
-        self.logger = Logger(self.config.log_dir)
+        self.logger = get_logger(self.config.log_dir)
 
         # 适配器列表
         self.adapters: List[MessageAdapter] = []
@@ -139,6 +140,33 @@ class MessengerService:
         """
         return self._send_to_all_image(image_path, level)
 
+    def send_with_image(self,
+                        content: str,
+                        image_path: str,
+                        level: MessageLevel = MessageLevel.INFO) -> bool:
+        """发送文本 + 图片（简化版 API）
+
+        支持图文合并的平台只发一次请求，其余平台依次发送文本和图片
+
+        Args:
+            content: 文本内容
+            image_path: 图片路径
+            level: 消息级别
+
+        Returns:
+            是否有任意一个发送成功
+        """
+        success = False
+        for adapter in self.adapters:
+            try:
+                recipient = self._get_default_recipient(adapter.platform_name)
+                if adapter.send_text_with_image(content, image_path, recipient):
+                    success = True
+            except Exception as e:
+                self.logger.log("messenger", "error", f"适配器异常: {e}")
+
+        return success
+
     # ==================== 发送消息（完整 API）====================
 
     def send_message(self, message: Message, platform: Optional[str] = None) -> bool:
@@ -6,22 +6,33 @@
 2. 判断是否应该停止服务
 3. 维护状态（连续失败次数、最后通知时间）
 """
+import threading
+import time
 from dataclasses import dataclass
 from typing import Optional
 from datetime import datetime, timedelta
-from enum import Enum
+from enum import IntEnum
 
-from src.common import Logger
+from src.common import get_logger
 
 
-class NotifyLevel(Enum):
-    """通知级别"""
-    INFO = "info"
-    WARNING = "warning"
-    DANGER = "danger"
+# 级别名称（按整数值索引，用于日志和 JSON 输出）
+_LEVEL_STR = ("info", "warning", "danger")
 
 
-@dataclass
+class NotifyLevel(IntEnum):
+    """通知级别（整数枚举，比较和序列化都更快）"""
+    INFO = 0
+    WARNING = 1
+    DANGER = 2
+
+    @property
+    def label(self) -> str:
+        """级别名称（"info" / "warning" / "danger"），用于日志和 JSON 输出"""
+        return _LEVEL_STR[self]
+
+
+@dataclass(frozen=True, slots=True)
 class NotifyResult:
     """通知结果"""
     should_notify: bool           # 是否应该通知
@@ -30,6 +41,15 @@ class NotifyResult:
     reason: str                   # 原因说明
 
 
+# "状态正常"结果是不可变的，所有调用共享同一个实例
+_RESULT_OK = NotifyResult(
+    should_notify=False,
+    should_stop=False,
+    level=NotifyLevel.INFO,
+    reason="状态正常"
+)
+
+
 class NotifyManager:
     """通知管理器
 
@@ -40,6 +60,13 @@ class NotifyManager:
     4. 每次重启服务时，连续失败次数重置为 0
     """
 
+    __slots__ = (
+        "min_notify_interval", "max_notify_interval", "_min_secs_f", "_max_secs_f",
+        "consecutive_fail_limit", "logger",
+        "last_notify_time", "_last_notify_mono", "consecutive_failures",
+        "_lock", "_status_lock", "_status_buf",
+    )
+
     def __init__(self,
                  min_notify_interval: int = 10,
                  max_notify_interval: int = 60,
@@ -54,12 +81,28 @@ class NotifyManager:
         """
         self.min_notify_interval = timedelta(minutes=min_notify_interval)
         self.max_notify_interval = timedelta(minutes=max_notify_interval)
+        # 间隔的秒数（float），用于热路径上的标量比较
+        self._min_secs_f = min_notify_interval * 60.0
+        self._max_secs_f = max_notify_interval * 60.0
         self.consecutive_fail_limit = consecutive_fail_limit
-        self.logger = Logger(log_dir)
+        self.logger = get_logger(log_dir)
 
         # 状态变量
-        self.last_notify_time: Optional[datetime] = None
+        self.last_notify_time: Optional[datetime] = None     # 墙上时间（用于展示）
+        self._last_notify_mono: Optional[float] = None       # 单调时钟（用于间隔计算）
         self.consecutive_failures = 0
+        # 保护上面状态变量的修改（只读快速路径不需要加锁）
+        self._lock = threading.Lock()
+
+        # 状态字典预先分配，get_status 时原地更新后返回副本
+        self._status_lock = threading.Lock()
+        self._status_buf = {
+            "consecutive_failures": 0,
+            "consecutive_fail_limit": consecutive_fail_limit,
+            "last_notify_time": None,
+            "min_notify_interval_minutes": min_notify_interval,
+            "max_notify_interval_minutes": max_notify_interval
+        }
 
         self.logger.log("notify_manager", "info",
                        f"NotifyManager 初始化 - min_interval={min_notify_interval}min, "
@@ -74,8 +117,26 @@ class NotifyManager:
         Returns:
             NotifyResult 对象
         """
-        now = datetime.now()
+        # 快速路径：合格且没有累计失败时（稳定运行的常见情况），
+        # "状态正常"分支不修改任何状态，无需加锁，也不构造 datetime
+        # （CPython 下单个属性读取是原子的）
+        if is_valid and self.consecutive_failures == 0:
+            last = self._last_notify_mono
+            if (last is not None
+                    and self._min_secs_f <= time.monotonic() - last <= self._max_secs_f
+                    and self.consecutive_fail_limit > 0):
+                return _RESULT_OK
 
+        with self._lock:
+            return self._decide(is_valid)
+
+    def _mark_notified(self, mono: float):
+        """记录本次通知时间"""
+        self._last_notify_mono = mono
+        self.last_notify_time = datetime.now()
+
+    def _decide(self, is_valid: bool) -> NotifyResult:
+        """需要修改状态的判断逻辑（调用方持有 self._lock）"""
         # 1. 检查是否应该停止服务（连续失败次数）
         if self.consecutive_failures >= self.consecutive_fail_limit:
             self.logger.log("notify_manager", "warning",
@@ -94,9 +155,10 @@ class NotifyManager:
             self.consecutive_failures += 1
 
         # 3. 检查通知间隔
-        if self.last_notify_time is None:
+        mono = time.monotonic()
+        if self._last_notify_mono is None:
             # 第一次，总是通知
-            self.last_notify_time = now
+            self._mark_notified(mono)
             level = NotifyLevel.WARNING if not is_valid else NotifyLevel.INFO
             return NotifyResult(
                 should_notify=True,
@@ -105,24 +167,24 @@ class NotifyManager:
                 reason="首次检查" if is_valid else "首次检查，发现问题"
             )
 
-        time_since_last_notify = now - self.last_notify_time
+        elapsed_s = mono - self._last_notify_mono
 
         # 4. 如果距离上次通知时间太短，不通知
-        if time_since_last_notify < self.min_notify_interval:
+        if elapsed_s < self._min_secs_f:
             self.logger.log("notify_manager", "info",
-                           f"距离上次通知时间太短 ({time_since_last_notify.seconds}s)，不通知")
+                           f"距离上次通知时间太短 ({int(elapsed_s)}s)，不通知")
             return NotifyResult(
                 should_notify=False,
                 should_stop=False,
                 level=NotifyLevel.INFO,
-                reason=f"距离上次通知仅 {time_since_last_notify.seconds}s，小于最小间隔"
+                reason=f"距离上次通知仅 {int(elapsed_s)}s，小于最小间隔"
             )
 
         # 5. 如果距离上次通知时间太久，强制通知
-        if time_since_last_notify > self.max_notify_interval:
-            self.last_notify_time = now
+        if elapsed_s > self._max_secs_f:
+            self._mark_notified(mono)
             self.logger.log("notify_manager", "info",
-                           f"距离上次通知时间太久 ({time_since_last_notify.seconds}s)，强制通知")
+                           f"距离上次通知时间太久 ({int(elapsed_s)}s)，强制通知")
             return NotifyResult(
                 should_notify=True,
                 should_stop=False,
@@ -132,7 +194,7 @@ class NotifyManager:
 
         # 6. 正常情况：如果不合格，通知
         if not is_valid:
-            self.last_notify_time = now
+            self._mark_notified(mono)
             return NotifyResult(
                 should_notify=True,
                 should_stop=False,
@@ -141,17 +203,14 @@ class NotifyManager:
             )
 
         # 7. 合格且在时间范围内，不通知
-        return NotifyResult(
-            should_notify=False,
-            should_stop=False,
-            level=NotifyLevel.INFO,
-            reason="状态正常"
-        )
+        return _RESULT_OK
 
     def reset(self):
         """重置状态（用于重启服务时）"""
-        self.consecutive_failures = 0
-        self.last_notify_time = None
+        with self._lock:
+            self.consecutive_failures = 0
+            self.last_notify_time = None
+            self._last_notify_mono = None
         self.logger.log("notify_manager", "info", "状态已重置")
 
     def update_config(self,
@@ -167,25 +226,32 @@ class NotifyManager:
         """
         if min_notify_interval is not None:
             self.min_notify_interval = timedelta(minutes=min_notify_interval)
+            self._min_secs_f = min_notify_interval * 60.0
+            self._status_buf["min_notify_interval_minutes"] = int(self.min_notify_interval.total_seconds() / 60)
             self.logger.log("notify_manager", "info",
                            f"配置已更新: min_notify_interval = {min_notify_interval}")
 
         if max_notify_interval is not None:
             self.max_notify_interval = timedelta(minutes=max_notify_interval)
+            self._max_secs_f = max_notify_interval * 60.0
+            self._status_buf["max_notify_interval_minutes"] = int(self.max_notify_interval.total_seconds() / 60)
             self.logger.log("notify_manager", "info",
                            f"配置已更新: max_notify_interval = {max_notify_interval}")
 
         if consecutive_fail_limit is not None:
             self.consecutive_fail_limit = consecutive_fail_limit
+            self._status_buf["consecutive_fail_limit"] = consecutive_fail_limit
             self.logger.log("notify_manager", "info",
                            f"配置已更新: consecutive_fail_limit = {consecutive_fail_limit}")
 
     def get_status(self) -> dict:
-        """获取状态"""
-        return {
-            "consecutive_failures": self.consecutive_failures,
-            "consecutive_fail_limit": self.consecutive_fail_limit,
-            "last_notify_time": self.last_notify_time.isoformat() if self.last_notify_time else None,
-            "min_notify_interval_minutes": int(self.min_notify_interval.total_seconds() / 60),
-            "max_notify_interval_minutes": int(self.max_notify_interval.total_seconds() / 60)
-        }
+        """获取状态
+
+        只原地更新会变化的字段（配置字段在 update_config 时更新），
+        返回浅拷贝，调用方可以随意修改。
+        """
+        with self._status_lock:
+            buf = self._status_buf
+            buf["consecutive_failures"] = self.consecutive_failures
+            buf["last_notify_time"] = self.last_notify_time.isoformat() if self.last_notify_time else None
+            return buf.copy()
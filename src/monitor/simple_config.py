@@ -3,58 +3,171 @@ Monitor 简化配置
 
 所有参数统一为 key:value 格式，保存到 JSON 文件
 """
-import json
-from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional
+import os
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Callable
 from pathlib import Path
 from datetime import datetime
 
+from src.common import json_loads, json_dumps_pretty
+
+
+@lru_cache(maxsize=4)
+def _load_config_dict(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """读取并解析配置文件（按路径 + 修改时间 + 大小缓存，文件变化后自动失效）
+
+    返回的字典是共享的缓存对象，调用方不能修改
+    """
+    return json_loads(Path(path).read_bytes())
+
+
+def _int_coerce(value):
+    """数值字段转换（前端传来的可能是字符串）"""
+    if value is not None and value != "":
+        return int(value)
+    return value
+
+
+def _bool_coerce(value):
+    """布尔字段转换（兼容 "true"/"1"/"yes" 等字符串）"""
+    if isinstance(value, str):
+        return value.lower() in ('true', '1', 'yes')
+    return value
+
+
+def _identity(value):
+    return value
+
+
+_INT_FIELDS = frozenset({"min_notify_interval", "max_notify_interval", "consecutive_fail_limit",
+                         "capture_interval", "preview_duration"})
+_BOOL_FIELDS = frozenset({"enable_preview", "enable_time_scheduler"})
+
+# 配置字段及默认值（顺序即 JSON 文件中的顺序）
+# rules 为可变对象，默认值在构造时单独复制
+_DEFAULTS: Dict[str, Any] = {
+    "rules": None,                      # 规则配置（RuleChecker 用）
+    "min_notify_interval": 10,          # 最小通知间隔（分钟）- 如果上次通知时间太短，不通知
+    "max_notify_interval": 60,          # 最大通知间隔（分钟）- 如果上次通知时间太久，强制通知
+    "consecutive_fail_limit": 5,        # 连续失败次数限制 - 超过后停止服务
+    "auto_start_time": None,            # 每日自动开始时间（HH:MM 格式）
+    "auto_stop_time": None,             # 每日自动停止时间（HH:MM 格式）
+    "enable_time_scheduler": False,     # 是否启用时间调度
+    "capture_interval": 30,             # 截图间隔（秒）
+    "preview_duration": 10,             # 预览时长（秒）
+    "enable_preview": True,             # 是否启用预览
+    "log_dir": "logs",                  # 日志目录
+}
+
+# 默认规则（模块级常量，只创建一次；get_default 返回时复制）
+_DEFAULT_RULES = (
+    {"key": "at_desk", "regexp": "^true$"},
+    {"key": "is_study", "regexp": "^true$"},
+    {"key": "activity", "regexp": "^(看书|写字)$"},
+    {"key": "posture", "regexp": "^(端正)$"},
+    {"key": "lighting", "regexp": "^(充足|一般)$"}
+)
+
+# 可更新字段 -> 类型转换函数（一次性生成）
+_FIELD_COERCERS: Dict[str, Callable[[Any], Any]] = {
+    name: (_int_coerce if name in _INT_FIELDS
+           else _bool_coerce if name in _BOOL_FIELDS
+           else _identity)
+    for name in _DEFAULTS
+}
+
+
+def _parse_hhmm(value: Optional[str]) -> Optional[int]:
+    """把 HH:MM 解析为当天的分钟数，未配置时返回 None"""
+    if not value:
+        return None
+    hour, minute = map(int, value.split(':'))
+    return hour * 60 + minute
+
+
+def _field_property(name: str) -> property:
+    """生成直接读写 self._data 的属性（写入时做类型转换）"""
+    coerce = _FIELD_COERCERS[name]
+
+    def getter(self):
+        return self._data[name]
+
+    def setter(self, value):
+        self._data[name] = coerce(value)
+
+    return property(getter, setter)
+
 
-@dataclass
 class MonitorConfig:
     """Monitor 统一配置
 
-    所有参数都保存在一个 JSON 文件中
+    所有参数都保存在一个 JSON 文件中。
+    内部直接以字典（与 JSON 结构一致）保存，字段通过属性访问，
+    加载/保存时不再在 dataclass 和 dict 之间来回转换。
     """
-    # 规则配置（RuleChecker 用）
-    rules: List[Dict[str, str]] = field(default_factory=list)
 
-    # 通知相关参数
-    min_notify_interval: int = 10       # 最小通知间隔（分钟）- 如果上次通知时间太短，不通知
-    max_notify_interval: int = 60       # 最大通知间隔（分钟）- 如果上次通知时间太久，强制通知
-    consecutive_fail_limit: int = 5     # 连续失败次数限制 - 超过后停止服务
+    def __init__(self, _config_file: Optional[str] = None,
+                 _data: Optional[Dict[str, Any]] = None, **kwargs):
+        """
+        Args:
+            _config_file: 配置文件路径（内部使用，用于自动保存）
+            _data: 已规范化的配置字典（内部使用，直接接管，不复制）
+            **kwargs: 配置字段，未提供的使用默认值
+        """
+        if _data is None:
+            _data = dict(_DEFAULTS)
+            _data["rules"] = []
+        for key, value in kwargs.items():
+            coerce = _FIELD_COERCERS.get(key)
+            if coerce is None:
+                raise TypeError(f"未知的配置项: {key}")
+            _data[key] = coerce(value)
+        self._data = _data
+        self._config_file = _config_file
+        # HH:MM -> 分钟数 的解析缓存：{字段名: (原始字符串, 分钟数)}
+        self._minutes_cache: Dict[str, tuple] = {}
+
+    rules = _field_property("rules")
+    min_notify_interval = _field_property("min_notify_interval")
+    max_notify_interval = _field_property("max_notify_interval")
+    consecutive_fail_limit = _field_property("consecutive_fail_limit")
+    auto_start_time = _field_property("auto_start_time")
+    auto_stop_time = _field_property("auto_stop_time")
+    enable_time_scheduler = _field_property("enable_time_scheduler")
+    capture_interval = _field_property("capture_interval")
+    preview_duration = _field_property("preview_duration")
+    enable_preview = _field_property("enable_preview")
+    log_dir = _field_property("log_dir")
 
-    # 监控时间相关
-    auto_start_time: Optional[str] = None   # 每日自动开始时间（HH:MM 格式）
-    auto_stop_time: Optional[str] = None    # 每日自动停止时间（HH:MM 格式）
-    enable_time_scheduler: bool = False     # 是否启用时间调度
+    def _total_minutes(self, name: str) -> Optional[int]:
+        """读取 HH:MM 字段对应的分钟数（原始值变化时自动重新解析）"""
+        raw = self._data[name]
+        cached = self._minutes_cache.get(name)
+        if cached is None or cached[0] != raw:
+            cached = self._minutes_cache[name] = (raw, _parse_hhmm(raw))
+        return cached[1]
 
-    # 监控参数
-    capture_interval: int = 30              # 截图间隔（秒）
-    preview_duration: int = 10             # 预览时长（秒）
-    enable_preview: bool = True            # 是否启用预览
+    @property
+    def start_total_min(self) -> Optional[int]:
+        """每日自动开始时间（当天的分钟数）"""
+        return self._total_minutes("auto_start_time")
 
-    # 日志目录
-    log_dir: str = "logs"
+    @property
+    def stop_total_min(self) -> Optional[int]:
+        """每日自动停止时间（当天的分钟数）"""
+        return self._total_minutes("auto_stop_time")
 
-    # 配置文件路径（内部使用）
-    _config_file: Optional[str] = field(default=None, repr=False)
+    def __repr__(self) -> str:
+        return f"MonitorConfig({self._data!r})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, MonitorConfig):
+            return NotImplemented
+        return self._data == other._data
 
     def to_dict(self) -> Dict[str, Any]:
-        """转换为字典"""
-        return {
-            "rules": self.rules,
-            "min_notify_interval": self.min_notify_interval,
-            "max_notify_interval": self.max_notify_interval,
-            "consecutive_fail_limit": self.consecutive_fail_limit,
-            "auto_start_time": self.auto_start_time,
-            "auto_stop_time": self.auto_stop_time,
-            "enable_time_scheduler": self.enable_time_scheduler,
-            "capture_interval": self.capture_interval,
-            "preview_duration": self.preview_duration,
-            "enable_preview": self.enable_preview,
-            "log_dir": self.log_dir
-        }
+        """转换为字典（浅拷贝）"""
+        return self._data.copy()
 
     @classmethod
     def from_dict(cls, config_dict: Dict[str, Any], config_file: str = None) -> 'MonitorConfig':
@@ -76,20 +189,17 @@ class MonitorConfig:
             except (ValueError, TypeError):
                 return default
 
-        return cls(
-            rules=config_dict.get("rules", []),
-            min_notify_interval=to_int(config_dict.get("min_notify_interval"), 10),
-            max_notify_interval=to_int(config_dict.get("max_notify_interval"), 60),
-            consecutive_fail_limit=to_int(config_dict.get("consecutive_fail_limit"), 5),
-            auto_start_time=config_dict.get("auto_start_time"),
-            auto_stop_time=config_dict.get("auto_stop_time"),
-            enable_time_scheduler=config_dict.get("enable_time_scheduler", False),
-            capture_interval=to_int(config_dict.get("capture_interval"), 30),
-            preview_duration=to_int(config_dict.get("preview_duration"), 10),
-            enable_preview=config_dict.get("enable_preview", True),
-            log_dir=config_dict.get("log_dir", "logs"),
-            _config_file=config_file
-        )
+        # 一次遍历直接构建内部字典
+        data = {}
+        for key, default in _DEFAULTS.items():
+            if key in _INT_FIELDS:
+                data[key] = to_int(config_dict.get(key), default)
+            else:
+                data[key] = config_dict.get(key, default)
+        if data["rules"] is None:
+            data["rules"] = []
+
+        return cls(_config_file=config_file, _data=data)
 
     def save(self):
         """保存配置到文件"""
@@ -97,8 +207,24 @@ class MonitorConfig:
             config_file = Path(self._config_file)
             config_file.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(config_file, "w", encoding="utf-8") as f:
-                json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+            # 先写临时文件再原子替换，写到一半崩溃也不会留下残缺的配置文件
+            tmp_file = config_file.with_name(config_file.name + ".tmp")
+            tmp_file.write_bytes(json_dumps_pretty(self._data))
+            os.replace(tmp_file, config_file)
+
+    def apply(self, **kwargs):
+        """只更新内存中的配置（不保存，由调用方决定何时 save）
+
+        Args:
+            **kwargs: 要更新的配置项
+        """
+        data = self._data
+        for key, value in kwargs.items():
+            # 只接受公开的配置字段，并按字段类型转换
+            coerce = _FIELD_COERCERS.get(key)
+            if coerce is None:
+                continue
+            data[key] = coerce(value)
 
     def update(self, **kwargs):
         """更新配置并自动保存
@@ -106,19 +232,7 @@ class MonitorConfig:
         Args:
             **kwargs: 要更新的配置项
         """
-        for key, value in kwargs.items():
-            if hasattr(self, key) and not key.startswith("_"):
-                # 类型转换：数值字段需要转换为整数
-                if key in ["min_notify_interval", "max_notify_interval", "consecutive_fail_limit",
-                          "capture_interval", "preview_duration"]:
-                    if value is not None and value != "":
-                        value = int(value)
-                # 布尔字段转换
-                elif key in ["enable_preview", "enable_time_scheduler"]:
-                    if isinstance(value, str):
-                        value = value.lower() in ('true', '1', 'yes')
-
-                setattr(self, key, value)
+        self.apply(**kwargs)
 
         # 自动保存
         self.save()
@@ -142,23 +256,22 @@ class MonitorConfig:
             default_config.save()
             return default_config
 
-        # 加载配置
-        with open(config_path, "r", encoding="utf-8") as f:
-            config_dict = json.load(f)
+        # 加载配置（文件未变化时直接使用缓存的解析结果）
+        stat = config_path.stat()
+        config_dict = _load_config_dict(str(config_path), stat.st_mtime_ns, stat.st_size)
 
+        # from_dict 会新建顶层字典；可变的只有规则列表，只复制它，避免修改规则时污染缓存
+        rules = config_dict.get("rules")
+        if isinstance(rules, list):
+            config_dict = {**config_dict,
+                           "rules": [dict(rule) if isinstance(rule, dict) else rule for rule in rules]}
         return cls.from_dict(config_dict, config_file)
 
     @classmethod
     def get_default(cls) -> 'MonitorConfig':
         """获取默认配置"""
         return cls(
-            rules=[
-                {"key": "at_desk", "regexp": "^true$"},
-                {"key": "is_study", "regexp": "^true$"},
-                {"key": "activity", "regexp": "^(看书|写字)$"},
-                {"key": "posture", "regexp": "^(端正)$"},
-                {"key": "lighting", "regexp": "^(充足|一般)$"}
-            ],
+            rules=[dict(rule) for rule in _DEFAULT_RULES],
             min_notify_interval=10,
             max_notify_interval=60,
             consecutive_fail_limit=5,
@@ -3,19 +3,58 @@
 
 使用统一配置文件，支持自动保存/加载
 """
-import time
+import queue
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, time as dt_time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from dataclasses import dataclass, field
 
-from src.common import Logger
+from src.common import get_logger
+from src.messenger import MessageLevel
 from .simple_config import MonitorConfig
 from .simple_rule_checker import SimpleRuleChecker, create_simple_rule_checker
 from .notify_manager import NotifyManager, NotifyResult, NotifyLevel
 
+# 后台 I/O（保存记录、发送通知）线程数，以及允许排队的最大任务数
+_IO_WORKERS = 4
+_IO_MAX_PENDING = 8
+
+# 从外部停止监控时，等待流水线线程处理完最后一张截图的最长时间（秒）
+_STAGE_JOIN_TIMEOUT = 10
+
+# NotifyLevel -> MessageLevel
+_LEVEL_MAP = {
+    NotifyLevel.INFO: MessageLevel.INFO,
+    NotifyLevel.WARNING: MessageLevel.WARNING,
+    NotifyLevel.DANGER: MessageLevel.DANGER,
+}
+
+# 流水线结束标记
+_STOP = object()
+
+
+def _put_latest(q: queue.Queue, item) -> bool:
+    """放入队列，队列已满时丢弃最旧的一项（只保留最新数据）
+
+    Returns:
+        是否丢弃了旧数据
+    """
+    dropped = False
+    while True:
+        try:
+            q.put_nowait(item)
+            return dropped
+        except queue.Full:
+            try:
+                q.get_nowait()
+                dropped = True
+            except queue.Empty:
+                pass
+
 
-@dataclass
+@dataclass(slots=True)
 class MonitorStatus:
     """Monitor 状态"""
     is_monitoring: bool = False
@@ -63,7 +102,9 @@ class SimpleMonitorService:
         self.storage = storage_service
         self.config = config
 
-        self.logger = Logger(config.log_dir)
+        self.logger = get_logger(config.log_dir)
+        # 热路径（每次截图）上的 info 日志先判断级别，关闭时连格式化都跳过
+        self._log_info = self.logger.info_enabled
 
         # 规则检查器
         self.rule_checker = create_simple_rule_checker(
@@ -83,9 +124,27 @@ class SimpleMonitorService:
         self._monitoring = False
         self._time_scheduler_running = False
         self._monitor_thread: Optional[threading.Thread] = None
+        self._stage_threads: list = []   # 流水线的分析/后处理线程
+        self._session = 0                # 监控会话编号，每次 start_monitor 加 1
         self._time_scheduler_thread: Optional[threading.Thread] = None
+        # 停止信号：等待期间直接阻塞在 Event 上，停止时立即唤醒
+        self._stop_event = threading.Event()
+        self._scheduler_stop_event = threading.Event()
         self.status = MonitorStatus()
 
+        # 状态版本号：状态变化时递增，get_status 在版本未变时直接返回缓存
+        self._status_lock = threading.Lock()
+        self._status_changed = threading.Condition(self._status_lock)   # 版本号变化时通知 wait_status
+        self._status_version = 0
+        self._status_cache: Optional[tuple] = None    # (版本号, 状态字典)
+
+        # 配置保存锁：多个请求同时修改配置时依次写盘（共用同一个临时文件）
+        self._config_save_lock = threading.Lock()
+
+        # 后台 I/O 线程池：保存记录和发送通知不阻塞截图节奏
+        self._io_pool = ThreadPoolExecutor(max_workers=_IO_WORKERS, thread_name_prefix="MonitorIO")
+        self._io_slots = threading.BoundedSemaphore(_IO_MAX_PENDING)
+
         self.logger.log("monitor", "info",
                        f"SimpleMonitorService 初始化 - 截图间隔: {config.capture_interval}s")
 
@@ -107,7 +166,8 @@ class SimpleMonitorService:
         - enable_preview: 是否启用预览
         """
         # 更新配置对象（会自动保存到文件）
-        self.config.update(**kwargs)
+        with self._config_save_lock:
+            self.config.update(**kwargs)
 
         # 同步更新子模块
         if "rules" in kwargs:
@@ -135,6 +195,7 @@ class SimpleMonitorService:
                 consecutive_fail_limit=int(kwargs["consecutive_fail_limit"]) if kwargs.get("consecutive_fail_limit") is not None else None
             )
 
+        self._bump_status()
         self.logger.log("monitor", "info", f"配置已更新: {list(kwargs.keys())}")
 
     # ==================== 核心业务流程 ====================
@@ -155,123 +216,169 @@ class SimpleMonitorService:
         Returns:
             NotifyResult 对象
         """
-        self.logger.log("monitor", "info", f"开始处理截图: {image_path}")
+        if self._log_info:
+            self.logger.log("monitor", "info", f"开始处理截图: {image_path}")
 
         try:
             # 1. AI 分析
-            analysis = self.vision.analyze(image_path)
-            self.logger.log("monitor", "info", f"分析结果: {analysis}")
+            analysis = self._analyze(image_path)
 
-            # 2. 规则检查
-            rule_check_result = self.rule_checker.check(analysis)
-            self.logger.log("monitor", "info",
-                           f"规则检查: {rule_check_result.is_valid}")
+            # 2-6. 规则检查、通知管理、保存记录、发送通知
+            notify_result = self._postprocess(image_path, analysis)
+
+        except Exception as e:
+            self.logger.log("monitor", "error", f"处理截图异常: {e}")
+            notify_result = NotifyResult(
+                should_notify=False,
+                should_stop=False,
+                level=NotifyLevel.INFO,
+                reason=f"处理失败: {str(e)}"
+            )
 
-            # 3. 通知管理
-            notify_result = self.notify_manager.should_notify_stop(rule_check_result.is_valid)
+        return notify_result
+
+    def _analyze(self, image_path: str) -> dict:
+        """流程第 1 步：AI 分析"""
+        # 截图文件由摄像头后台线程写入，分析前确认已写完
+        self.camera.flush()
+        analysis = self.vision.analyze(image_path)
+        if self._log_info:
+            self.logger.log("monitor", "info", f"分析结果: {analysis}")
+        return analysis
+
+    def _postprocess(self, image_path: str, analysis: dict) -> NotifyResult:
+        """流程第 2-6 步：规则检查、通知管理、保存记录、发送通知"""
+        # 2. 规则检查（只判断是否合规，失败明细在保存记录时再生成）
+        is_valid = self.rule_checker.is_valid(analysis)
+        if self._log_info:
+            self.logger.log("monitor", "info", f"规则检查: {is_valid}")
+
+        # 3. 通知管理
+        notify_result = self.notify_manager.should_notify_stop(is_valid)
+        if self._log_info:
             self.logger.log("monitor", "info",
                            f"通知结果: should_notify={notify_result.should_notify}, "
                            f"should_stop={notify_result.should_stop}, reason={notify_result.reason}")
 
-            # 更新状态
+        # 更新状态（计数在状态锁内自增：多个线程同时更新时不会丢失，也不会倒退）
+        with self._status_lock:
             self.status.last_notify_result = notify_result
             self.status.snapshots_processed += 1
             self.status.consecutive_failures = self.notify_manager.consecutive_failures
+        self._bump_status()
+
+        # 4. 保存检测记录（后台执行；队列满时等待，记录不丢弃）
+        self._submit_io(self._save_detection_record,
+                        image_path, notify_result, is_valid, analysis)
+
+        # 5. 发送通知（后台执行；积压时丢弃本次通知）
+        if notify_result.should_notify:
+            if not self._submit_io(self._send_notification,
+                                   notify_result, image_path, analysis,
+                                   self.notify_manager.consecutive_failures,
+                                   drop_if_busy=True):
+                self.logger.log("monitor", "warning", "后台任务积压，丢弃本次通知")
+
+        # 6. 检查是否应该停止服务
+        if notify_result.should_stop:
+            self.logger.log("monitor", "warning", "达到连续失败限制，停止监控")
+            self.stop_monitor()
 
-            # 4. 保存检测记录
-            self._save_detection_record(image_path, notify_result, rule_check_result, analysis)
-
-            # 5. 发送通知
-            if notify_result.should_notify:
-                self._send_notification(notify_result, image_path, analysis)
+        return notify_result
 
-            # 6. 检查是否应该停止服务
-            if notify_result.should_stop:
-                self.logger.log("monitor", "warning", "达到连续失败限制，停止监控")
-                self.stop_monitor()
+    def _submit_io(self, fn, *args, drop_if_busy: bool = False) -> bool:
+        """提交后台 I/O 任务（排队数量受信号量限制）
 
-        except Exception as e:
-            self.logger.log("monitor", "error", f"处理截图异常: {e}")
-            notify_result = NotifyResult(
-                should_notify=False,
-                should_stop=False,
-                level=NotifyLevel.INFO,
-                reason=f"处理失败: {str(e)}"
-            )
+        Args:
+            fn: 要执行的函数
+            *args: 函数参数
+            drop_if_busy: 队列已满时是否直接放弃（否则等待空位）
 
-        return notify_result
+        Returns:
+            是否已提交
+        """
+        if not self._io_slots.acquire(blocking=not drop_if_busy):
+            return False
+        try:
+            future = self._io_pool.submit(fn, *args)
+        except RuntimeError:
+            # 线程池已关闭
+            self._io_slots.release()
+            return False
+        future.add_done_callback(lambda _: self._io_slots.release())
+        return True
 
     def _save_detection_record(self, image_path: str, notify_result: NotifyResult,
-                               rule_check_result, analysis: dict):
+                               is_valid: bool, analysis: dict):
         """保存检测记录"""
         try:
-            issues = list(rule_check_result.failed_fields.values())
+            # 只有不合规时才需要完整检查一次，收集失败原因
+            issues = [] if is_valid else self.rule_checker.check(analysis).issues
 
-            # 保存到数据库
-            self.storage.save(
+            # 加入存储服务的写入队列（由后台线程批量写入数据库）
+            queued = self.storage.save(
                 image_path=image_path,
-                is_valid=rule_check_result.is_valid,
+                is_valid=is_valid,
                 issues=issues,
                 should_notify=notify_result.should_notify,
                 analysis=analysis
             )
 
-            self.logger.log("monitor", "info", "检测记录已保存")
+            if queued and self._log_info:
+                self.logger.log("monitor", "info", "检测记录已加入保存队列")
 
         except Exception as e:
             self.logger.log("monitor", "error", f"保存检测记录失败: {e}")
 
-    def _send_notification(self, notify_result: NotifyResult, image_path: str, analysis: dict):
+    def _send_notification(self, notify_result: NotifyResult, image_path: str, analysis: dict,
+                           consecutive_failures: int):
         """发送通知
 
         Args:
             notify_result: 通知结果
             image_path: 图片路径
             analysis: AI分析结果（包含所有key:value）
+            consecutive_failures: 提交时的连续失败次数（后台执行时状态可能已变化）
         """
         try:
-            # 构建消息内容
-            message = f"Study Buddy Notification\n\n"
-            message += f"Consecutive Failures: {self.notify_manager.consecutive_failures}\n\n"
+            # 构建消息内容（收集各行后一次拼接）
+            parts = [
+                "Study Buddy Notification",
+                "",
+                f"Consecutive Failures: {consecutive_failures}",
+                "",
+                "Analysis Results:",
+            ]
 
             # 添加所有AI分析结果的key:value
-            message += f"Analysis Results:\n"
-            for key, value in analysis.items():
-                message += f"  {key}: {value}\n"
+            parts.extend(f"  {key}: {value}" for key, value in analysis.items())
 
-            message += f"\nTime: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+            parts.append("")
+            parts.append(f"Time: {datetime.now().isoformat(sep=' ', timespec='seconds')}")
+            message = "\n".join(parts)
 
-            # 发送文本消息
-            text_success = self.messenger.send(
+            # 文本和图片一起发送（支持的平台合并为一次请求）
+            success = self.messenger.send_with_image(
                 message,
+                image_path,
                 self._convert_level(notify_result.level)
             )
-            self.logger.log("monitor", "info", f"文本消息发送: {'成功' if text_success else '失败'}")
-
-            # 发送图片（无论文本是否成功都尝试发送）
-            image_success = self.messenger.send_image(image_path, self._convert_level(notify_result.level))
-            self.logger.log("monitor", "info", f"图片消息发送: {'成功' if image_success else '失败'}")
+            self.logger.log("monitor", "info", f"通知消息发送: {'成功' if success else '失败'}")
 
-            if text_success or image_success:
-                self.status.notifications_sent += 1
+            if success:
+                # 在 I/O 线程池中执行，多个发送可能同时完成
+                with self._status_lock:
+                    self.status.notifications_sent += 1
+                self._bump_status()
             else:
                 self.logger.log("monitor", "error", "通知发送失败")
 
         except Exception as e:
             self.logger.log("monitor", "error", f"发送通知异常: {e}")
 
-    def _convert_level(self, level: NotifyLevel):
+    def _convert_level(self, level: NotifyLevel) -> MessageLevel:
         """转换通知级别"""
-        from src.messenger import MessageLevel
-
-        if level == NotifyLevel.INFO:
-            return MessageLevel.INFO
-        elif level == NotifyLevel.WARNING:
-            return MessageLevel.WARNING
-        elif level == NotifyLevel.DANGER:
-            return MessageLevel.DANGER
-        else:
-            return MessageLevel.INFO
+        return _LEVEL_MAP.get(level, MessageLevel.INFO)
 
     # ==================== 监控循环管理 ====================
 
@@ -282,12 +389,15 @@ class SimpleMonitorService:
             return False
 
         self.logger.log("monitor", "info", "启动监控循环")
+        self._stop_event.clear()
+        self._session += 1
         self._monitoring = True
         self.status.is_monitoring = True
         self.status.start_time = datetime.now()
 
         # 重置通知管理器状态
         self.notify_manager.reset()
+        self._bump_status()
 
         # 在后台线程运行监控循环
         self._monitor_thread = threading.Thread(
@@ -302,7 +412,7 @@ class SimpleMonitorService:
     def stop_monitor(self) -> bool:
         """停止监控循环
 
-        注意：这个方法可能从监控线程内部调用（通过 process_snapshot），
+        注意：这个方法可能从监控流水线内部调用（通过 process_snapshot），
         也可能从外部调用（通过 API 或时间调度器）。
         """
         if not self._monitoring:
@@ -311,18 +421,20 @@ class SimpleMonitorService:
 
         self.logger.log("monitor", "info", "停止监控循环")
         self._monitoring = False
+        self._stop_event.set()
         self.status.is_monitoring = False
         self.status.stop_time = datetime.now()
+        self._bump_status()
 
         # 检查是否在监控线程内部调用
         current_thread = threading.current_thread()
         is_called_from_monitor_thread = (
-            self._monitor_thread is not None and
-            current_thread == self._monitor_thread
+            (self._monitor_thread is not None and current_thread == self._monitor_thread) or
+            current_thread in self._stage_threads
         )
 
         if is_called_from_monitor_thread:
-            # 从监控线程内部调用：不能 join 自己，只设置标志
+            # 从监控流水线内部调用：不能 join 自己，只设置标志
             self.logger.log("monitor", "info", "从监控线程内部调用停止，不等待线程结束")
         else:
             # 从外部调用：等待监控线程结束
@@ -331,6 +443,13 @@ class SimpleMonitorService:
                 self._monitor_thread.join(timeout=5)
                 self._monitor_thread = None
 
+            # 等待正在进行的 AI 分析和最后一张截图的后处理完成，再释放摄像头
+            deadline = time.monotonic() + _STAGE_JOIN_TIMEOUT
+            for thread in self._stage_threads:
+                thread.join(timeout=max(0.0, deadline - time.monotonic()))
+                if thread.is_alive():
+                    self.logger.log("monitor", "warning", f"{thread.name} 未在超时内结束，结果将被丢弃")
+
         # 释放摄像头资源
         if self.camera:
             self.camera.shutdown()
@@ -370,7 +489,34 @@ class SimpleMonitorService:
                 self.logger.log("monitor", "info", "预览阶段终止（监控已停止），跳过摄像头操作")
 
     def _run_monitor_loop(self):
-        """运行监控循环"""
+        """运行监控流水线
+
+        截图 → AI 分析 → 规则检查/通知/保存 三个阶段分别在独立线程中运行，
+        阶段之间用容量为 1 的队列连接：下一次截图不必等待 AI 分析完成，
+        处理不过来时丢弃最旧的数据，只处理最新的截图。
+        截图阶段在当前（监控）线程中运行。
+        """
+        capture_q: queue.Queue = queue.Queue(maxsize=1)
+        result_q: queue.Queue = queue.Queue(maxsize=1)
+
+        self._stage_threads = [
+            threading.Thread(target=self._analyze_stage, args=(capture_q, result_q),
+                             name="MonitorAnalyze", daemon=True),
+            threading.Thread(target=self._postprocess_stage, args=(result_q, self._session),
+                             name="MonitorPostprocess", daemon=True),
+        ]
+        for thread in self._stage_threads:
+            thread.start()
+
+        try:
+            self._capture_stage(capture_q)
+        finally:
+            # 通知下游阶段结束（不等待，避免与后处理阶段中的 stop_monitor 互相等待）；
+            # 被挤掉的截图是停止后才会分析的，分析阶段本来也会跳过
+            _put_latest(capture_q, _STOP)
+
+    def _capture_stage(self, out_q: queue.Queue):
+        """流水线阶段 1：按间隔截图"""
         while self._monitoring:
             try:
                 # 1. 触发截图
@@ -380,10 +526,12 @@ class SimpleMonitorService:
                     self._sleep_with_interrupt(self.config.capture_interval)
                     continue
 
-                self.logger.log("monitor", "info", f"监控截图: {image_path}")
+                if self._log_info:
+                    self.logger.log("monitor", "info", f"监控截图: {image_path}")
 
-                # 2. 处理截图
-                self.process_snapshot(image_path)
+                # 2. 交给分析阶段（分析跟不上时丢弃未处理的旧截图）
+                if _put_latest(out_q, image_path):
+                    self.logger.log("monitor", "warning", "AI 分析跟不上截图速度，丢弃旧截图")
 
                 # 3. 等待下次截图（可中断）
                 self._sleep_with_interrupt(self.config.capture_interval)
@@ -392,15 +540,56 @@ class SimpleMonitorService:
                 self.logger.log("monitor", "error", f"监控循环异常: {e}")
                 self._sleep_with_interrupt(5)
 
-    def _sleep_with_interrupt(self, duration: float):
-        """可中断的睡眠（用于快速响应停止信号）"""
-        end_time = time.time() + duration
-        while self._monitoring and time.time() < end_time:
-            # 每次最多睡 0.5 秒，然后检查 _monitoring 标志
-            remaining = end_time - time.time()
-            if remaining <= 0:
+    def _analyze_stage(self, in_q: queue.Queue, out_q: queue.Queue):
+        """流水线阶段 2：AI 分析"""
+        try:
+            while True:
+                image_path = in_q.get()
+                if image_path is _STOP:
+                    break
+                if not self._monitoring:
+                    continue
+
+                if self._log_info:
+                    self.logger.log("monitor", "info", f"开始处理截图: {image_path}")
+                try:
+                    analysis = self._analyze(image_path)
+                except Exception as e:
+                    self.logger.log("monitor", "error", f"处理截图异常: {e}")
+                    continue
+
+                _put_latest(out_q, (image_path, analysis))
+        finally:
+            # 阻塞放入：不能挤掉还没有后处理的最后一次分析结果（后处理阶段总会取走）
+            out_q.put(_STOP)
+
+    def _postprocess_stage(self, in_q: queue.Queue, session: int):
+        """流水线阶段 3：规则检查、通知管理、保存记录、发送通知
+
+        Args:
+            session: 所属的监控会话编号（停止后又重新启动时，旧会话的结果不再处理）
+        """
+        while True:
+            item = in_q.get()
+            if item is _STOP:
                 break
-            time.sleep(min(0.5, remaining))
+
+            image_path, analysis = item
+            if session != self._session:
+                self.logger.log("monitor", "warning", f"监控已重新启动，丢弃上一次监控的分析结果: {image_path}")
+                continue
+            try:
+                self._postprocess(image_path, analysis)
+            except Exception as e:
+                self.logger.log("monitor", "error", f"处理截图异常: {e}")
+
+    def _sleep_with_interrupt(self, duration: float) -> bool:
+        """可中断的睡眠（用于快速响应停止信号）
+
+        Returns:
+            是否因停止信号而提前返回
+        """
+        return self._stop_event.wait(duration)
 
     # ==================== 时间调度管理 ====================
 
@@ -422,8 +611,10 @@ class SimpleMonitorService:
                        f"启动时间调度器 - 开始: {self.config.auto_start_time}, "
                        f"停止: {self.config.auto_stop_time}")
 
+        self._scheduler_stop_event.clear()
         self._time_scheduler_running = True
         self.status.is_time_scheduler_running = True
+        self._bump_status()
 
         # 在后台线程运行时间调度
         self._time_scheduler_thread = threading.Thread(
@@ -443,7 +634,9 @@ class SimpleMonitorService:
 
         self.logger.log("monitor", "info", "停止时间调度器")
         self._time_scheduler_running = False
+        self._scheduler_stop_event.set()
         self.status.is_time_scheduler_running = False
+        self._bump_status()
 
         # 等待时间调度线程结束
         if self._time_scheduler_thread:
@@ -459,19 +652,18 @@ class SimpleMonitorService:
         last_check_minute = None
         last_auto_start_date = None  # 记录上次自动启动的日期
 
-        # 解析配置的时间
-        start_hour, start_min = map(int, self.config.auto_start_time.split(':'))
-        stop_hour, stop_min = map(int, self.config.auto_stop_time.split(':'))
-
         while self._time_scheduler_running:
             try:
                 now = datetime.now()
                 current_date = now.date()
-                current_hour = now.hour
-                current_min = now.minute
-                current_total_min = current_hour * 60 + current_min
-                start_total_min = start_hour * 60 + start_min
-                stop_total_min = stop_hour * 60 + stop_min
+                current_total_min = now.hour * 60 + now.minute
+                # 配置对象缓存了解析结果，每次读取都能反映最新配置
+                start_total_min = self.config.start_total_min
+                stop_total_min = self.config.stop_total_min
+                if start_total_min is None or stop_total_min is None:
+                    # 时间被清空（通常随后会重启调度器），本轮跳过
+                    self._scheduler_stop_event.wait(60)
+                    continue
 
                 # 检查是否跨天，如果是新的一天，重置状态
                 if last_check_date is None or last_check_date != current_date:
@@ -515,19 +707,64 @@ class SimpleMonitorService:
                 last_check_minute=current_total_min
 
 
-                # 每分钟检查一次
-                time.sleep(60)
+                # 每分钟检查一次（停止时立即唤醒）
+                self._scheduler_stop_event.wait(60)
 
             except Exception as e:
                 self.logger.log("monitor", "error", f"时间调度异常: {e}")
                 import traceback
                 traceback.print_exc()
-                time.sleep(60)
+                self._scheduler_stop_event.wait(60)
 
     # ==================== 状态查询 ====================
 
+    def _bump_status(self):
+        """标记状态已变化（在修改状态之后调用）"""
+        with self._status_lock:
+            self._status_version += 1
+            self._status_changed.notify_all()
+
     def get_status(self) -> Dict[str, Any]:
-        """获取服务状态"""
+        """获取服务状态
+
+        状态未变化时返回缓存的同一个字典，调用方只能读取（如直接序列化为 JSON），
+        需要修改时请自行复制。
+        """
+        with self._status_lock:
+            return self._cached_status()
+
+    def get_status_versioned(self) -> Tuple[int, Dict[str, Any]]:
+        """获取服务状态和它的版本号（版本号不变时状态字典也不变）"""
+        with self._status_lock:
+            return self._status_version, self._cached_status()
+
+    def wait_status(self, since_version: int, timeout: float) -> Tuple[int, Dict[str, Any]]:
+        """等待状态变化（用于状态推送）
+
+        Args:
+            since_version: 调用方已有状态的版本号（首次调用传 -1，立即返回）
+            timeout: 最长等待时间（秒）
+
+        Returns:
+            (版本号, 状态字典)；超时时版本号等于 since_version
+        """
+        with self._status_changed:
+            self._status_changed.wait_for(lambda: self._status_version != since_version, timeout)
+            return self._status_version, self._cached_status()
+
+    def _cached_status(self) -> Dict[str, Any]:
+        """返回当前版本的状态字典（调用方持有 self._status_lock）"""
+        version = self._status_version
+        cached = self._status_cache
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        status = self._build_status()
+        self._status_cache = (version, status)
+        return status
+
+    def _build_status(self) -> Dict[str, Any]:
+        """构建状态字典"""
         return {
             "is_monitoring": self.status.is_monitoring,
             "is_time_scheduler_running": self.status.is_time_scheduler_running,
@@ -540,7 +777,7 @@ class SimpleMonitorService:
                 "should_notify": self.status.last_notify_result.should_notify if self.status.last_notify_result else None,
                 "should_stop": self.status.last_notify_result.should_stop if self.status.last_notify_result else None,
                 "reason": self.status.last_notify_result.reason if self.status.last_notify_result else None,
-                "level": self.status.last_notify_result.level.value if self.status.last_notify_result else None
+                "level": self.status.last_notify_result.level.label if self.status.last_notify_result else None
             } if self.status.last_notify_result else None,
             "notify_manager": self.notify_manager.get_status(),
             "config": self.config.to_dict()
@@ -558,6 +795,9 @@ class SimpleMonitorService:
         if self._time_scheduler_running:
             self.stop_time_scheduler()
 
+        # 等待后台 I/O 任务完成
+        self._io_pool.shutdown(wait=True)
+
         self.logger.log("monitor", "info", "SimpleMonitorService 已关闭")
 
 
@@ -4,21 +4,357 @@
 只支持 key + regexp 的简单匹配
 """
 import re
-from typing import Dict, Any, List
-from dataclasses import dataclass
+import threading
+from itertools import product
+from typing import Dict, Any, List, Tuple, Pattern, Optional, Set, FrozenSet
 
-from src.common import Logger
+try:
+    from re import _parser as _sre_parse          # Python 3.11+
+    from re import _constants as _sre_c
+except ImportError:
+    import sre_parse as _sre_parse                # Python 3.10 及以下
+    import sre_constants as _sre_c
+from dataclasses import dataclass, field
 
+from src.common import get_logger
 
-@dataclass
+# 可选：Hyperscan 多模式匹配（未安装时回退到 re）
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+
+@dataclass(slots=True)
 class RuleCheckResult:
     """规则检查结果"""
     is_valid: bool                    # 是否整体合规
     failed_fields: Dict[str, str]     # 不合规的字段: {字段名: 失败原因}
     passed_fields: List[str]          # 合规的字段列表
     raw_analysis: dict                # 原始 AI 分析结果
+    issues: List[str] = field(default_factory=list)   # 失败原因列表（failed_fields 的值，保存记录时使用）
+
+
+# ==================== 纯字面量规则 ====================
+
+# 字面量规则最多展开的候选字符串数量
+_MAX_LITERALS = 256
+
+
+def _expand_literals(items) -> Optional[List[str]]:
+    """把不含锚点的解析树展开为所有可能的字面量字符串，无法展开时返回 None"""
+    results = [""]
+    for op, av in items:
+        if op is _sre_c.LITERAL:
+            choices = [chr(av)]
+        elif op is _sre_c.IN:
+            # 只支持由单个字符组成的字符集，例如 [Yy]
+            if not all(sub_op is _sre_c.LITERAL for sub_op, _ in av):
+                return None
+            choices = [chr(c) for _, c in av]
+        elif op is _sre_c.SUBPATTERN:
+            group, add_flags, del_flags, sub = av
+            if add_flags or del_flags:
+                return None
+            choices = _expand_literals(sub)
+        elif op is _sre_c.BRANCH:
+            choices = []
+            for alt in av[1]:
+                expanded = _expand_literals(alt)
+                if expanded is None:
+                    return None
+                choices.extend(expanded)
+        else:
+            return None
+
+        if choices is None or len(results) * len(choices) > _MAX_LITERALS:
+            return None
+        results = [a + b for a, b in product(results, choices)]
+    return results
+
+
+def _literal_set(regexp: str) -> Optional[FrozenSet[str]]:
+    """识别形如 ^foo$、^(a|b|c)$ 的纯字面量规则
+
+    Returns:
+        小写后的候选值集合（可直接用 value.lower() in ... 判断）；
+        不是纯字面量规则，或包含可能导致大小写语义不一致的字符时返回 None
+    """
+    try:
+        parsed = _sre_parse.parse(regexp)
+    except re.error:
+        return None
+    if parsed.state.flags & (re.ASCII | re.LOCALE | re.MULTILINE):
+        return None
+
+    items = list(parsed)
+    # re.match 本身就从开头匹配，开头的 ^ 可有可无；结尾必须是 $ 或 \Z
+    if items and items[0] in ((_sre_c.AT, _sre_c.AT_BEGINNING), (_sre_c.AT, _sre_c.AT_BEGINNING_STRING)):
+        items = items[1:]
+    if not items or items[-1][0] is not _sre_c.AT:
+        return None
+    at_end = items[-1][1]
+    if at_end is not _sre_c.AT_END and at_end is not _sre_c.AT_END_STRING:
+        return None
+
+    literals = _expand_literals(items[:-1])
+    if literals is None:
+        return None
+
+    # 只允许 ASCII 或无大小写的字符（如中文），保证 lower() 比较与 IGNORECASE 一致
+    for literal in literals:
+        for ch in literal:
+            if not ch.isascii() and ch.lower() != ch.upper():
+                return None
+
+    result = {literal.lower() for literal in literals}
+    if at_end is _sre_c.AT_END:
+        # $ 也匹配结尾换行符之前的位置
+        result.update([literal + "\n" for literal in result])
+    return frozenset(result)
+
+
+# ==================== 小写匹配 ====================
+
+# 重复、原子组等只需要检查子表达式的操作（POSSESSIVE_REPEAT、ATOMIC_GROUP 仅 3.11+ 存在）
+_REPEAT_OPS = tuple(op for op in (_sre_c.MAX_REPEAT, _sre_c.MIN_REPEAT,
+                                  getattr(_sre_c, "POSSESSIVE_REPEAT", None)) if op is not None)
+
+
+def _is_lower_char(code: int) -> bool:
+    """字符是否为非大写的 ASCII 字符，或没有大小写之分的字符（如中文）"""
+    ch = chr(code)
+    if code < 128:
+        return not ch.isupper()
+    return ch.lower() == ch.upper()
+
+
+def _is_case_safe(items) -> bool:
+    """判断解析树能否改为"值先转小写、正则不带 IGNORECASE"的匹配方式
+
+    要求所有字面量都是小写（或无大小写），字符范围只覆盖不含大写字母的 ASCII，
+    并且不包含内联标志、条件分组等难以判断的语法。
+    """
+    for op, av in items:
+        if op is _sre_c.LITERAL or op is _sre_c.NOT_LITERAL:
+            if not _is_lower_char(av):
+                return False
+        elif op is _sre_c.IN:
+            for sub_op, sub_av in av:
+                if sub_op is _sre_c.LITERAL:
+                    if not _is_lower_char(sub_av):
+                        return False
+                elif sub_op is _sre_c.RANGE:
+                    lo, hi = sub_av
+                    # 范围不能越出 ASCII，也不能包含 A-Z
+                    if hi >= 128 or (lo <= ord("Z") and hi >= ord("A")):
+                        return False
+                elif sub_op is not _sre_c.NEGATE and sub_op is not _sre_c.CATEGORY:
+                    return False
+        elif op is _sre_c.ANY or op is _sre_c.AT or op is _sre_c.GROUPREF:
+            continue
+        elif op in _REPEAT_OPS:
+            if not _is_case_safe(av[2]):
+                return False
+        elif op is _sre_c.SUBPATTERN:
+            group, add_flags, del_flags, sub = av
+            if add_flags or del_flags or not _is_case_safe(sub):
+                return False
+        elif op is _sre_c.BRANCH:
+            if not all(_is_case_safe(alt) for alt in av[1]):
+                return False
+        elif op is _sre_c.ASSERT or op is _sre_c.ASSERT_NOT:
+            if not _is_case_safe(av[1]):
+                return False
+        elif op is getattr(_sre_c, "ATOMIC_GROUP", None):
+            if not _is_case_safe(av):
+                return False
+        else:
+            return False
+    return True
+
+
+def _lower_pattern(regexp: str) -> Optional[Pattern]:
+    """为只含小写字面量的规则编译一个不带 IGNORECASE 的版本
+
+    对 ASCII 值，pattern.match(value.lower()) 与带 IGNORECASE 的匹配结果一致，
+    省去 SRE 引擎逐字符做大小写折叠的开销；含大写字母或 [A-Z] 之类的规则返回 None，
+    继续使用 IGNORECASE。非 ASCII 值（lower() 可能改变长度）始终走 IGNORECASE 版本。
+    """
+    try:
+        parsed = _sre_parse.parse(regexp)
+    except re.error:
+        return None
+    if parsed.state.flags & (re.ASCII | re.LOCALE | re.IGNORECASE):
+        return None
+    if not _is_case_safe(list(parsed)):
+        return None
+    return re.compile(regexp)
 
 
+# ==================== Hyperscan ====================
+
+class _HyperscanScanner:
+    """把所有规则编译进一个 Hyperscan 数据库，一次扫描得到命中的规则编号
+
+    每条规则包装为 ^(?:regexp)，模拟 re.match 从开头匹配的语义。
+    Hyperscan 的大小写折叠和字符类与 re 的 Unicode 规则不完全一致（例如 ı/İ），
+    所以只收纯 ASCII 的规则，也只扫描纯 ASCII 的值；其余情况仍用 re 匹配。
+    """
+
+    def __init__(self, patterns: List[Tuple[int, str]]):
+        """
+        Args:
+            patterns: [(规则编号, 正则表达式), ...]
+        """
+        # 规则和值都是 ASCII，ASCII 范围内的大小写折叠和 \w、\d、\s 与 re 一致
+        flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+        self._db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        self._db.compile(
+            expressions=[f"^(?:{p})".encode("utf-8") for _, p in patterns],
+            ids=[rule_id for rule_id, _ in patterns],
+            elements=len(patterns),
+            flags=[flags] * len(patterns)
+        )
+        # 数据库中包含的规则编号
+        self.rule_ids = frozenset(rule_id for rule_id, _ in patterns)
+        # scratch 空间不能并发使用
+        self._lock = threading.Lock()
+
+    def scan(self, value: str) -> Set[int]:
+        """扫描一个字段值（只能是 ASCII 字符串），返回命中的规则编号集合"""
+        hits = set()
+
+        def on_match(rule_id, start, end, flags, context):
+            hits.add(rule_id)
+
+        with self._lock:
+            self._db.scan(value.encode("ascii"), match_event_handler=on_match)
+        return hits
+
+
+def _build_hyperscan(patterns: List[Tuple[int, str]]) -> Optional[_HyperscanScanner]:
+    """尝试构建 Hyperscan 扫描器，不可用或规则不受支持时返回 None"""
+    if hyperscan is None:
+        return None
+    patterns = [(rule_id, p) for rule_id, p in patterns if p.isascii()]
+    if not patterns:
+        return None
+    try:
+        return _HyperscanScanner(patterns)
+    except Exception:
+        # 例如反向引用、环视等 Hyperscan 不支持的语法
+        return None
+
+
+# ==================== 代码生成 ====================
+
+# 字段缺失标记（区分"字段不存在"和"值为 None"）
+_MISSING = object()
+
+
+def _rule_condition(rule_id: int, literals: Optional[FrozenSet[str]],
+                    lower_pattern: Optional[Pattern], hs: Optional[_HyperscanScanner]) -> str:
+    """生成判断字段值 v 是否符合第 rule_id 条规则的表达式"""
+    if literals is not None:
+        return f"v.lower() in L{rule_id} or (not v.isascii() and P{rule_id}(v) is not None)"
+    if hs is not None and rule_id in hs.rule_ids:
+        # 非 ASCII 值交给 re（Unicode 大小写折叠）
+        return (f"({rule_id} in (hits[v] if v in hits else hits.setdefault(v, _hs_scan(v))) "
+                f"if v.isascii() else P{rule_id}(v) is not None)")
+    if lower_pattern is not None:
+        return f"(C{rule_id}(v.lower()) if v.isascii() else P{rule_id}(v)) is not None"
+    return f"P{rule_id}(v) is not None"
+
+
+def _build_namespace(compiled, hs: Optional[_HyperscanScanner]) -> Dict[str, Any]:
+    """生成代码用到的常量（正则的 match 方法、字面量集合、Hyperscan 扫描函数）"""
+    namespace: Dict[str, Any] = {"_MISSING": _MISSING}
+    if hs is not None:
+        namespace["_hs_scan"] = hs.scan
+    for rule_id, (_, pattern, literals, lower_pattern) in enumerate(compiled):
+        namespace[f"P{rule_id}"] = pattern.match
+        if literals is not None:
+            namespace[f"L{rule_id}"] = literals
+        if lower_pattern is not None:
+            namespace[f"C{rule_id}"] = lower_pattern.match
+    return namespace
+
+
+def _build_check_fast(compiled, hs: Optional[_HyperscanScanner]):
+    """为固定的规则集生成专用的检查函数
+
+    每条规则展开成一段直线代码（字段名、正则、字面量集合都作为常量嵌入），
+    运行时不再遍历规则列表、解包元组。逻辑与 SimpleRuleChecker._match 一致。
+
+    Returns:
+        函数 check_fast(analysis) -> (failed_fields, passed_fields)
+    """
+    namespace = _build_namespace(compiled, hs)
+    lines = [
+        "def check_fast(analysis):",
+        "    failed = {}",
+        "    passed = []",
+        "    get = analysis.get",
+    ]
+    if hs is not None:
+        lines.append("    hits = {}")
+
+    for rule_id, (key, pattern, literals, lower_pattern) in enumerate(compiled):
+        k = repr(key)
+        lines += [
+            f"    v = get({k}, _MISSING)",
+            "    if v is _MISSING:",
+            f"        failed[{k}] = {repr(f'{key}: None')}",
+            "    else:",
+            "        if type(v) is not str:",
+            "            v = str(v)",
+            f"        if {_rule_condition(rule_id, literals, lower_pattern, hs)}:",
+            f"            passed.append({k})",
+            "        else:",
+            f"            failed[{k}] = {repr(f'{key}: ')} + v",
+        ]
+    lines.append("    return failed, passed")
+
+    exec("\n".join(lines), namespace)
+    return namespace["check_fast"]
+
+
+def _build_is_valid_fast(compiled, hs: Optional[_HyperscanScanner]):
+    """为固定的规则集生成只判断是否合规的函数
+
+    与 check_fast 逻辑相同，但遇到第一条不合规的规则就返回 False，
+    后面的规则不再匹配，也不收集 failed/passed。
+
+    Returns:
+        函数 is_valid_fast(analysis) -> bool
+    """
+    namespace = _build_namespace(compiled, hs)
+    lines = [
+        "def is_valid_fast(analysis):",
+        "    get = analysis.get",
+    ]
+    if hs is not None:
+        lines.append("    hits = {}")
+
+    for rule_id, (key, pattern, literals, lower_pattern) in enumerate(compiled):
+        lines += [
+            f"    v = get({repr(key)}, _MISSING)",
+            "    if v is _MISSING:",
+            "        return False",
+            "    if type(v) is not str:",
+            "        v = str(v)",
+            f"    if not ({_rule_condition(rule_id, literals, lower_pattern, hs)}):",
+            "        return False",
+        ]
+    lines.append("    return True")
+
+    exec("\n".join(lines), namespace)
+    return namespace["is_valid_fast"]
+
+
+# ==================== 规则检查器 ====================
+
 class SimpleRuleChecker:
     """简化版规则检查器
 
@@ -34,58 +370,73 @@ class SimpleRuleChecker:
             log_dir: 日志目录
         """
         self.rules = rules
-        self.logger = Logger(log_dir)
+        self.logger = get_logger(log_dir)
 
-        # 验证规则
-        self._validate_rules()
+        # 验证并预编译规则
+        self._compiled = self._compile_rules(rules)
+        self._hs = self._build_scanner(self._compiled)
+        self._check_fast = _build_check_fast(self._compiled, self._hs)
+        self._is_valid_fast = _build_is_valid_fast(self._compiled, self._hs)
 
         self.logger.log("rule_checker", "info",
                        f"SimpleRuleChecker 初始化 - {len(rules)} 条规则")
 
-    def _validate_rules(self):
-        """验证规则配置"""
-        for rule in self.rules:
+    @staticmethod
+    def _compile_rules(rules: List[Dict[str, str]]) -> List[Tuple[str, Pattern, Optional[FrozenSet[str]],
+                                                                  Optional[Pattern]]]:
+        """验证规则配置并预编译正则表达式
+
+        Returns:
+            [(字段名, 编译后的正则, 纯字面量规则的候选值集合或 None,
+              用于匹配小写值的无 IGNORECASE 正则或 None), ...]
+        """
+        compiled = []
+        for rule in rules:
             if "key" not in rule or "regexp" not in rule:
                 raise ValueError(f"规则格式错误，必须包含 key 和 regexp: {rule}")
 
-            # 验证正则表达式是否有效
+            # 编译即验证
             try:
-                re.compile(rule["regexp"])
+                pattern = re.compile(rule["regexp"], re.IGNORECASE)
             except re.error as e:
                 raise ValueError(f"无效的正则表达式 [{rule['key']}]: {rule['regexp']}, 错误: {e}")
+            literals = _literal_set(rule["regexp"])
+            # 字面量规则已经用集合查找，不需要小写版本的正则
+            lower_pattern = _lower_pattern(rule["regexp"]) if literals is None else None
+            compiled.append((rule["key"], pattern, literals, lower_pattern))
+        return compiled
 
-    def check(self, analysis: Dict[str, Any]) -> RuleCheckResult:
-        """检查分析结果是否符合规则
+    @staticmethod
+    def _build_scanner(compiled) -> Optional[_HyperscanScanner]:
+        """为非字面量规则构建 Hyperscan 扫描器"""
+        return _build_hyperscan([(rule_id, pattern.pattern)
+                                 for rule_id, (_, pattern, literals, _) in enumerate(compiled)
+                                 if literals is None])
+
+    def is_valid(self, analysis: Dict[str, Any]) -> bool:
+        """只判断分析结果是否整体合规（遇到第一条不合规的规则即返回）
+
+        只需要结论、不需要失败明细时使用，比 check() 少做匹配和对象构建。
 
         Args:
             analysis: AI 分析结果（JSON dict）
 
         Returns:
-            RuleCheckResult 对象
+            是否合规
         """
-        failed_fields = {}
-        passed_fields = []
-
-        for rule in self.rules:
-            key = rule["key"]
-            regexp = rule["regexp"]
+        return self._is_valid_fast(analysis)
 
-            # 检查字段是否存在
-            if key not in analysis:
-                failed_fields[key] = self._get_friendly_message(key, None, "字段缺失")
-                continue
+    def check(self, analysis: Dict[str, Any]) -> RuleCheckResult:
+        """检查分析结果是否符合规则
 
-            # 获取字段值
-            value = str(analysis[key])
+        Args:
+            analysis: AI 分析结果（JSON dict）
 
-            # 正则匹配
-            try:
-                if re.match(regexp, value, re.IGNORECASE):
-                    passed_fields.append(key)
-                else:
-                    failed_fields[key] = self._get_friendly_message(key, value, regexp)
-            except re.error:
-                failed_fields[key] = f"规则配置错误: {regexp}"
+        Returns:
+            RuleCheckResult 对象
+        """
+        # 使用为当前规则集生成的专用函数
+        failed_fields, passed_fields = self._check_fast(analysis)
 
         is_valid = len(failed_fields) == 0
 
@@ -93,15 +444,99 @@ class SimpleRuleChecker:
             is_valid=is_valid,
             failed_fields=failed_fields,
             passed_fields=passed_fields,
-            raw_analysis=analysis
+            raw_analysis=analysis,
+            issues=list(failed_fields.values())
         )
 
-        self.logger.log("rule_checker", "info",
-                       f"规则检查完成 - 合规: {is_valid}, "
-                       f"通过: {len(passed_fields)}, 失败: {len(failed_fields)}")
+        if self.logger.info_enabled:
+            self.logger.log("rule_checker", "info",
+                           f"规则检查完成 - 合规: {is_valid}, "
+                           f"通过: {len(passed_fields)}, 失败: {len(failed_fields)}")
 
         return result
 
+    def check_many(self, analyses: List[Dict[str, Any]]) -> List[RuleCheckResult]:
+        """批量检查多条分析结果（例如回放/补录一批截图）
+
+        按规则逐列处理：同一规则下相同的字段值只匹配一次，
+        规则相关的开销分摊到整批数据上。
+
+        Args:
+            analyses: AI 分析结果列表
+
+        Returns:
+            与输入顺序一致的 RuleCheckResult 列表
+        """
+        if len(analyses) <= 1:
+            return [self.check(analysis) for analysis in analyses]
+
+        hs = self._hs
+        hs_hits: Dict[str, Set[int]] = {}
+        failed_rows: List[Dict[str, str]] = [{} for _ in analyses]
+        passed_rows: List[List[str]] = [[] for _ in analyses]
+
+        for rule_id, (key, pattern, literals, lower_pattern) in enumerate(self._compiled):
+            memo: Dict[str, bool] = {}      # 字段值 -> 是否匹配（本规则内）
+            for row, analysis in enumerate(analyses):
+                if key not in analysis:
+                    failed_rows[row][key] = self._get_friendly_message(key, None, "字段缺失")
+                    continue
+
+                value = analysis[key]
+                if type(value) is not str:
+                    value = str(value)
+                matched = memo.get(value)
+                if matched is None:
+                    matched = memo[value] = self._match(rule_id, pattern, literals, lower_pattern,
+                                                                value, hs, hs_hits)
+
+                if matched:
+                    passed_rows[row].append(key)
+                else:
+                    failed_rows[row][key] = self._get_friendly_message(key, value, pattern.pattern)
+
+        results = [
+            RuleCheckResult(
+                is_valid=not failed,
+                failed_fields=failed,
+                passed_fields=passed,
+                raw_analysis=analysis,
+                issues=list(failed.values())
+            )
+            for analysis, failed, passed in zip(analyses, failed_rows, passed_rows)
+        ]
+
+        if self.logger.info_enabled:
+            valid_count = sum(1 for r in results if r.is_valid)
+            self.logger.log("rule_checker", "info",
+                           f"批量规则检查完成 - 共 {len(results)} 条, 合规: {valid_count}")
+
+        return results
+
+    @staticmethod
+    def _match(rule_id: int, pattern: Pattern, literals: Optional[FrozenSet[str]],
+               lower_pattern: Optional[Pattern], value: str, hs: Optional[_HyperscanScanner], hs_hits: Dict[str, Set[int]]) -> bool:
+        """判断单个字段值是否符合规则"""
+        # 纯字面量规则：集合查找；未命中的非 ASCII 值交给正则确认（大小写折叠的特殊字符）
+        if literals is not None:
+            if value.lower() in literals:
+                return True
+            if value.isascii():
+                return False
+            return pattern.match(value) is not None
+
+        # 正则匹配（Hyperscan 可用时用多模式扫描，同一个值只扫描一次；非 ASCII 值交给 re）
+        if hs is not None and rule_id in hs.rule_ids and value.isascii():
+            hits = hs_hits.get(value)
+            if hits is None:
+                hits = hs_hits[value] = hs.scan(value)
+            return rule_id in hits
+
+        # 规则只含小写字面量时，ASCII 值先转小写再用不带 IGNORECASE 的正则匹配
+        if lower_pattern is not None and value.isascii():
+            return lower_pattern.match(value.lower()) is not None
+        return pattern.match(value) is not None
+
     def _get_friendly_message(self, key: str, value: str, expected) -> str:
         """生成友好的错误消息
 
@@ -122,8 +557,12 @@ class SimpleRuleChecker:
         Args:
             new_rules: 新的规则列表，格式：[{"key": "at_desk", "regexp": "^true$"}, ...]
         """
+        # 先编译，失败时保留原有规则
+        self._compiled = self._compile_rules(new_rules)
+        self._hs = self._build_scanner(self._compiled)
+        self._check_fast = _build_check_fast(self._compiled, self._hs)
+        self._is_valid_fast = _build_is_valid_fast(self._compiled, self._hs)
         self.rules = new_rules
-        self._validate_rules()
 
         self.logger.log("rule_checker", "info",
                        f"规则已更新 - {len(new_rules)} 条规则")
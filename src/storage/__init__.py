@@ -24,15 +24,21 @@ storage.save(
 today_records = storage.get_today()
 for record in today_records:
     print(f"{record['timestamp']}: {record['is_valid']} - {record['issues']}")
+
+# 列表页：分页获取摘要（不含 analysis），详情再按 id 查询
+page = storage.list_today(limit=20, offset=0)
+detail = storage.get_record(page[0]["id"], page[0]["timestamp"])
 ```
 """
 
 from .detection_record_service import (
     DetectionRecordService,
-    get_detection_record_service
+    get_detection_record_service,
+    SUMMARY_COLUMNS
 )
 
 __all__ = [
     'DetectionRecordService',
     'get_detection_record_service',
+    'SUMMARY_COLUMNS',
 ]
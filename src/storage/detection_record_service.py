@@ -7,14 +7,154 @@
 
 存储方式：SQLite 数据库
 """
+import itertools
+import queue
 import sqlite3
-import json
 import threading
-from datetime import datetime, date
-from typing import List, Dict, Any, Optional
+import time
+from contextlib import contextmanager
+from datetime import datetime, date, timedelta
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
-from src.common import Logger
+from src.common import get_logger, json_dumps, json_loads
+
+# 后台写入：每批最多合并的记录数，以及收到第一条记录后最多等待的时间（秒）
+_BATCH_MAX = 64
+_BATCH_WAIT = 0.1
+
+# 最多保留的空闲只读连接数（超出的连接用完即关闭）
+_READ_POOL_SIZE = 4
+
+# 批量写入失败时的重试次数和间隔（秒），例如数据库被其他进程长时间锁定
+_WRITE_RETRIES = 3
+_RETRY_DELAY = 1.0
+
+# 写入线程结束标记
+_STOP = object()
+
+# 表结构：按 (timestamp, id) 聚簇存储的 WITHOUT ROWID 表，
+# 按时间范围查询直接扫描主键 B 树，插入时也少维护一棵 rowid B 树
+_CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS detection_records (
+        timestamp TEXT NOT NULL,
+        id INTEGER NOT NULL,
+        image_path TEXT NOT NULL,
+        is_valid INTEGER NOT NULL CHECK (is_valid IN (0, 1)),
+        issues TEXT,
+        should_notify INTEGER NOT NULL CHECK (should_notify IN (0, 1)),
+        analysis_json TEXT NOT NULL,
+        PRIMARY KEY (timestamp, id)
+    ) WITHOUT ROWID
+"""
+
+# ==================== SQL 语句 ====================
+# 统一定义为模块级常量：每个连接的语句缓存（cached_statements）按 SQL 文本命中，
+# 同一条语句只在每个连接上准备一次
+
+# 每个连接缓存的预编译语句数量
+_CACHED_STATEMENTS = 256
+
+_INSERT_SQL = (
+    "INSERT INTO detection_records"
+    "(timestamp, id, image_path, is_valid, issues, should_notify, analysis_json) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+# 今天的完整记录（get_today）
+_SELECT_TODAY_SQL = """
+    SELECT id, timestamp, image_path, is_valid,
+           issues, should_notify, analysis_json
+    FROM detection_records
+    WHERE timestamp >= ? AND timestamp < ?
+    ORDER BY timestamp DESC
+"""
+
+# 今天的记录摘要，分页（list_today）
+_LIST_TODAY_SQL = """
+    SELECT id, timestamp, image_path, is_valid, issues, should_notify
+    FROM detection_records INDEXED BY idx_ts_cover
+    WHERE timestamp >= ? AND timestamp < ?
+    ORDER BY timestamp DESC, id DESC
+    LIMIT ? OFFSET ?
+"""
+
+# 最近的记录摘要（get_recent_rows）
+_LIST_RECENT_SQL = """
+    SELECT id, timestamp, image_path, is_valid, issues, should_notify
+    FROM detection_records INDEXED BY idx_ts_cover
+    ORDER BY timestamp DESC, id DESC
+    LIMIT ?
+"""
+
+# 按主键查询单条记录（get_record）
+_SELECT_BY_KEY_SQL = """
+    SELECT id, timestamp, image_path, is_valid,
+           issues, should_notify, analysis_json
+    FROM detection_records
+    WHERE timestamp = ? AND id = ?
+"""
+
+# 只按 id 查询单条记录（get_record，未提供 timestamp 时）
+_SELECT_BY_ID_SQL = """
+    SELECT id, timestamp, image_path, is_valid,
+           issues, should_notify, analysis_json
+    FROM detection_records
+    WHERE id = ?
+"""
+
+# 总数和今天的记录数（启动时初始化计数）
+_COUNT_SQL = """
+    SELECT COUNT(*),
+           SUM(CASE WHEN timestamp >= ? AND timestamp < ? THEN 1 ELSE 0 END)
+    FROM detection_records
+"""
+
+
+def _today_range() -> Tuple[str, str]:
+    """今天的时间范围 [今天, 明天)，用于 timestamp 列的范围查询
+
+    timestamp 以 'YYYY-MM-DD HH:MM:SS' 文本保存，按字典序即按时间排序，
+    因此 timestamp >= '今天' AND timestamp < '明天' 可以直接走索引，
+    不必对每行调用 date(timestamp)。
+    """
+    today = date.today()
+    return today.isoformat(), (today + timedelta(days=1)).isoformat()
+
+
+# 记录摘要查询的列名（与 _LIST_TODAY_SQL / _LIST_RECENT_SQL 的列顺序一致）
+SUMMARY_COLUMNS = ("id", "timestamp", "image_path", "is_valid", "issues", "should_notify")
+
+
+# 0/1 -> bool，按下标取值比调用 bool() 更快
+_BOOL = (False, True)
+
+
+def _row_to_summary(row: tuple) -> Dict[str, Any]:
+    """把 (id, timestamp, image_path, is_valid, issues, should_notify) 行转换为记录摘要"""
+    record_id, timestamp, image_path, is_valid, issues, should_notify = row
+    return {
+        "id": record_id,
+        "timestamp": timestamp,
+        "image_path": image_path,
+        "is_valid": _BOOL[is_valid],
+        "issues": json_loads(issues) if issues else [],
+        "should_notify": _BOOL[should_notify]
+    }
+
+
+def _row_to_record(row: tuple) -> Dict[str, Any]:
+    """把 (id, timestamp, image_path, is_valid, issues, should_notify, analysis_json) 行转换为完整记录"""
+    record_id, timestamp, image_path, is_valid, issues, should_notify, analysis_json = row
+    return {
+        "id": record_id,
+        "timestamp": timestamp,
+        "image_path": image_path,
+        "is_valid": _BOOL[is_valid],
+        "issues": json_loads(issues) if issues else [],
+        "should_notify": _BOOL[should_notify],
+        "analysis": json_loads(analysis_json)
+    }
 
 
 class DetectionRecordService:
@@ -27,7 +167,9 @@ class DetectionRecordService:
     设计原则：
     - 简洁：只实现必要功能
     - 轻量：使用 SQLite，无需额外服务
-    - 线程安全：使用锁保护数据库连接
+    - 线程安全：写连接由锁保护；查询从只读连接池借用连接，互不阻塞（WAL）
+    - 长连接：连接创建后一直复用，保留 SQLite 的页缓存，避免每次操作重新打开
+    - 异步写入：save() 只入队，后台线程把一段时间内的记录合并为一个事务提交
     """
 
     def __init__(self, db_path: str = "data/detection_records.db", log_dir: str = "logs"):
@@ -37,41 +179,138 @@ class DetectionRecordService:
             log_dir: 日志目录
         """
         self.db_path = db_path
-        self.logger = Logger(log_dir)
+        self.logger = get_logger(log_dir)
+        # save() 每次截图都会调用，info 日志先判断级别，关闭时连格式化都跳过
+        self._log_info = self.logger.info_enabled
 
-        # 线程安全锁
+        # 写锁：保护写连接和记录数缓存
         self._lock = threading.Lock()
 
+        # 空闲只读连接池（WAL 模式下读取不需要和写入互斥）
+        # Web 服务器可能每个请求一个新线程，连接不能按线程保存，否则每个线程都留下一个连接
+        self._read_pool: queue.LifoQueue = queue.LifoQueue(maxsize=_READ_POOL_SIZE)
+
         # 确保数据目录存在
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
+        # 写连接（自动提交模式），由 self._lock 保护，只用于建表和写入
+        # 不设置 row_factory：查询结果是普通元组，按位置解包
+        self._conn: Optional[sqlite3.Connection] = sqlite3.connect(
+            db_path, check_same_thread=False, isolation_level=None,
+            cached_statements=_CACHED_STATEMENTS
+        )
+
         # 初始化数据库
         self._init_database()
 
+        # 后台写入线程
+        self._closed = False
+        self._queue: queue.Queue = queue.Queue()
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop,
+            name="RecordWriter",
+            daemon=True
+        )
+        self._writer_thread.start()
+
         self.logger.log("storage", "info", f"DetectionRecordService 初始化 - 数据库: {db_path}")
 
     def _init_database(self):
         """初始化数据库表"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock:
+            conn = self._conn
+
+            # WAL 模式：读写互不阻塞；synchronous=NORMAL 在 WAL 下只在检查点时 fsync
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-20000")       # 约 20MB 页缓存
+            conn.execute("PRAGMA mmap_size=134217728")     # 128MB 内存映射
+
+            self._migrate_rowid_table(conn)
+            conn.execute(_CREATE_TABLE_SQL)
+
+            # 主键已按 timestamp 排序，按时间的查询都由下面的 idx_ts_cover 覆盖；
+            # 旧版本建过的 idx_ts_valid 没有查询使用，只会拖慢写入，这里删掉
+            conn.execute("DROP INDEX IF EXISTS idx_ts_valid")
+
+            # 覆盖列表页查询（list_today）需要的所有列，整页数据直接从索引读出
             conn.execute("""
-                CREATE TABLE IF NOT EXISTS detection_records (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    image_path TEXT NOT NULL,
-                    is_valid BOOLEAN NOT NULL,
-                    issues TEXT,
-                    should_notify BOOLEAN,
-                    analysis_json TEXT NOT NULL
-                )
+                CREATE INDEX IF NOT EXISTS idx_ts_cover
+                ON detection_records(timestamp DESC, id DESC, image_path, is_valid, should_notify, issues)
             """)
 
-            # 创建索引（加速查询）
+            # id 由客户端分配（WITHOUT ROWID 表没有自增列）
+            max_id = conn.execute("SELECT MAX(id) FROM detection_records").fetchone()[0]
+            self._id_counter = itertools.count((max_id or 0) + 1)
+
+            # 记录数缓存：启动时统计一次，之后由 save_many 维护，get_status 不再查询数据库
+            # 总数和今天的记录数在一次索引扫描中同时统计
+            start, end = _today_range()
+            total, today_count = conn.execute(_COUNT_SQL, (start, end)).fetchone()
+            self._total_count = total
+            self._today_count = today_count or 0     # 空表时 SUM 为 NULL
+            self._today_date = date.fromisoformat(start)
+
+    def _open_reader(self) -> sqlite3.Connection:
+        """创建一个只读连接"""
+        # 连接会在不同线程间借用（同一时间只有一个线程使用）
+        conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                               cached_statements=_CACHED_STATEMENTS)
+        conn.execute("PRAGMA query_only=1")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.execute("PRAGMA mmap_size=134217728")
+        return conn
+
+    @contextmanager
+    def _reader(self):
+        """从连接池借用一个只读连接，用完归还（池满或服务已关闭时直接关闭）"""
+        if self._closed:
+            raise sqlite3.ProgrammingError("存储服务已关闭")
+        try:
+            conn = self._read_pool.get_nowait()
+        except queue.Empty:
+            conn = self._open_reader()
+
+        try:
+            yield conn
+        finally:
+            if self._closed:
+                conn.close()
+            else:
+                try:
+                    self._read_pool.put_nowait(conn)
+                except queue.Full:
+                    conn.close()
+
+    def _migrate_rowid_table(self, conn: sqlite3.Connection):
+        """把旧版（id 自增主键的 rowid 表）数据迁移到 WITHOUT ROWID 表，只执行一次"""
+        row = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'detection_records'"
+        ).fetchone()
+        if row is None or "WITHOUT ROWID" in row[0].upper():
+            return
+
+        self.logger.log("storage", "info", "迁移 detection_records 为 WITHOUT ROWID 表")
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # 旧表的索引随表一起重命名，删除旧表时一并删除
+            conn.execute("ALTER TABLE detection_records RENAME TO detection_records_old")
+            conn.execute(_CREATE_TABLE_SQL)
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_timestamp
-                ON detection_records(timestamp)
+                INSERT INTO detection_records
+                (timestamp, id, image_path, is_valid, issues, should_notify, analysis_json)
+                SELECT COALESCE(timestamp, CURRENT_TIMESTAMP), id, image_path,
+                       CASE WHEN is_valid THEN 1 ELSE 0 END, issues,
+                       CASE WHEN should_notify THEN 1 ELSE 0 END, analysis_json
+                FROM detection_records_old
             """)
-
-            conn.commit()
+            conn.execute("DROP TABLE detection_records_old")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
 
     def save(self,
              image_path: str,
@@ -79,7 +318,7 @@ class DetectionRecordService:
              issues: List[str],
              should_notify: bool,
              analysis: dict) -> bool:
-        """保存检测记录
+        """保存检测记录（放入写入队列后立即返回，由后台线程批量提交）
 
         Args:
             image_path: 图片路径
@@ -89,29 +328,118 @@ class DetectionRecordService:
             analysis: 完整的 AI 分析结果（原始 JSON）
 
         Returns:
-            是否保存成功
+            是否已加入写入队列（服务已关闭时返回 False）
         """
-        try:
-            with self._lock:
-                with sqlite3.connect(self.db_path) as conn:
-                    # 将 issues 和 analysis 序列化为 JSON
-                    issues_json = json.dumps(issues, ensure_ascii=False)
-                    analysis_json = json.dumps(analysis, ensure_ascii=False)
+        if self._closed:
+            self.logger.log("storage", "error", "保存检测记录失败: 存储服务已关闭")
+            return False
 
-                    # 使用本地时间而不是 UTC
-                    from datetime import datetime
-                    local_timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self._queue.put({
+            # 记录产生的时间（而不是后台线程提交的时间）
+            "timestamp": datetime.now(),
+            "image_path": image_path,
+            "is_valid": is_valid,
+            "issues": issues,
+            "should_notify": should_notify,
+            "analysis": analysis
+        })
+        if self._log_info:
+            self.logger.log("storage", "info",
+                           f"检测记录已加入写入队列: is_valid={is_valid}, issues={len(issues)}")
+        return True
+
+    def _writer_loop(self):
+        """写入线程：收到记录后再等待一小段时间，把这期间的记录合并为一个事务提交"""
+        while True:
+            batch = [self._queue.get()]
+            stop = batch[0] is _STOP
+            deadline = time.monotonic() + _BATCH_WAIT
+            while not stop and len(batch) < _BATCH_MAX:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                batch.append(item)
+                stop = item is _STOP
+
+            try:
+                records = [item for item in batch if item is not _STOP]
+                if records:
+                    self._save_with_retry(records)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+            if stop:
+                return
+
+    def _save_with_retry(self, records: List[Dict[str, Any]]):
+        """写入一批记录，失败时间隔一段时间重试（每次失败 save_many 自己记录日志）"""
+        for attempt in range(_WRITE_RETRIES + 1):
+            if self.save_many(records):
+                return
+            if attempt < _WRITE_RETRIES:
+                time.sleep(_RETRY_DELAY)
+        self.logger.log("storage", "error",
+                       f"检测记录写入失败（已重试 {_WRITE_RETRIES} 次），丢弃 {len(records)} 条")
+
+    def flush(self):
+        """等待队列中的记录全部写入数据库"""
+        self._queue.join()
+
+    def save_many(self, records: List[Dict[str, Any]]) -> bool:
+        """批量保存检测记录（一个事务、一次提交）
 
-                    conn.execute("""
-                        INSERT INTO detection_records
-                        (timestamp, image_path, is_valid, issues, should_notify, analysis_json)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    """, (local_timestamp, image_path, is_valid, issues_json, should_notify, analysis_json))
+        Args:
+            records: 记录列表，每条记录包含 save() 的同名参数：
+                     image_path, is_valid, issues, should_notify, analysis；
+                     可选 timestamp（datetime，记录产生的时间，缺省为当前时间）
 
-                    conn.commit()
+        Returns:
+            是否全部保存成功（失败时整批回滚）
+        """
+        if not records:
+            return True
 
-            self.logger.log("storage", "info",
-                           f"保存检测记录: is_valid={is_valid}, issues={len(issues)}")
+        try:
+            # 序列化在锁外完成；使用本地时间而不是 UTC
+            # isoformat(' ', 'seconds') 输出 'YYYY-MM-DD HH:MM:SS'，与 strftime 相同但不需要解析格式串
+            now = datetime.now()
+            timestamps = [r.get("timestamp") or now for r in records]
+            rows = [
+                (ts.isoformat(' ', 'seconds'),
+                 next(self._id_counter),
+                 r["image_path"],
+                 1 if r["is_valid"] else 0,
+                 json_dumps(r["issues"]),
+                 1 if r["should_notify"] else 0,
+                 json_dumps(r["analysis"]))
+                for ts, r in zip(timestamps, records)
+            ]
+
+            with self._lock:
+                conn = self._conn
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.executemany(_INSERT_SQL, rows)
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                conn.execute("COMMIT")
+
+                # 提交成功后更新记录数缓存（跨天时今天的计数从 0 开始）
+                self._total_count += len(rows)
+                latest_date = max(timestamps).date()
+                if latest_date > self._today_date:
+                    self._today_date = latest_date
+                    self._today_count = 0
+                self._today_count += sum(1 for ts in timestamps if ts.date() == self._today_date)
+
+            if len(records) > 1:
+                self.logger.log("storage", "info", f"批量保存检测记录: {len(records)} 条")
             return True
 
         except Exception as e:
@@ -132,79 +460,138 @@ class DetectionRecordService:
             - analysis: 完整的 AI 分析结果
         """
         try:
-            with self._lock:
-                with sqlite3.connect(self.db_path) as conn:
-                    conn.row_factory = sqlite3.Row
-
-                    # 查询今天的记录
-                    today = date.today().isoformat()
-                    cursor = conn.execute("""
-                        SELECT id, timestamp, image_path, is_valid,
-                               issues, should_notify, analysis_json
-                        FROM detection_records
-                        WHERE date(timestamp) = ?
-                        ORDER BY timestamp DESC
-                    """, (today,))
-
-                    rows = cursor.fetchall()
-
-                    # 转换为字典列表
-                    records = []
-                    for row in rows:
-                        record = {
-                            "id": row["id"],
-                            "timestamp": row["timestamp"],
-                            "image_path": row["image_path"],
-                            "is_valid": bool(row["is_valid"]),
-                            "issues": json.loads(row["issues"]) if row["issues"] else [],
-                            "should_notify": bool(row["should_notify"]),
-                            "analysis": json.loads(row["analysis_json"])
-                        }
-                        records.append(record)
-
-                    self.logger.log("storage", "info", f"查询今天记录: {len(records)} 条")
-                    return records
+            # 查询今天的记录（范围查询，走 timestamp 索引）
+            start, end = _today_range()
+            with self._reader() as conn:
+                rows = conn.execute(_SELECT_TODAY_SQL, (start, end)).fetchall()
+
+            # 转换为字典列表
+            records = [_row_to_record(row) for row in rows]
+
+            self.logger.log("storage", "info", f"查询今天记录: {len(records)} 条")
+            return records
 
         except Exception as e:
             self.logger.log("storage", "error", f"查询今天记录失败: {e}")
             return []
 
-    def get_status(self) -> Dict[str, Any]:
-        """获取存储状态
+    def get_today_rows(self) -> List[tuple]:
+        """获取今天所有检测记录的摘要（数据库原始行，Web API 按列格式直接返回）
+
+        与 list_today() 相同，只读取 idx_ts_cover 覆盖的列（不含 analysis_json）；
+        不同的是每条记录是按 SUMMARY_COLUMNS 排列的元组，不转换为字典：
+        is_valid / should_notify 为 0/1，issues 保持 JSON 字符串，不做反序列化。
+        """
+        try:
+            start, end = _today_range()
+            # LIMIT -1 表示不限制条数
+            with self._reader() as conn:
+                return conn.execute(_LIST_TODAY_SQL, (start, end, -1, 0)).fetchall()
+
+        except Exception as e:
+            self.logger.log("storage", "error", f"查询今天记录失败: {e}")
+            return []
+
+    def get_recent_rows(self, limit: int = 10) -> List[tuple]:
+        """获取最近检测记录的摘要（格式同 get_today_rows()）
+
+        Args:
+            limit: 最多返回的条数
+        """
+        try:
+            with self._reader() as conn:
+                return conn.execute(_LIST_RECENT_SQL, (limit,)).fetchall()
+
+        except Exception as e:
+            self.logger.log("storage", "error", f"查询最近记录失败: {e}")
+            return []
+
+    def list_today(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+        """分页获取今天的检测记录摘要（不含 analysis，列表页使用）
+
+        只读取 idx_ts_cover 覆盖的列，不访问保存完整 AI 结果的主表行。
+
+        Args:
+            limit: 最多返回的条数
+            offset: 跳过的条数
 
         Returns:
-            状态字典
+            检测记录列表，字段同 get_today()，但没有 analysis
         """
         try:
-            with self._lock:
-                with sqlite3.connect(self.db_path) as conn:
-                    # 总记录数
-                    cursor = conn.execute("SELECT COUNT(*) as total FROM detection_records")
-                    total = cursor.fetchone()["total"]
-
-                    # 今天的记录数
-                    today = date.today().isoformat()
-                    cursor = conn.execute("""
-                        SELECT COUNT(*) as today_count
-                        FROM detection_records
-                        WHERE date(timestamp) = ?
-                    """, (today,))
-                    today_count = cursor.fetchone()["today_count"]
-
-                    return {
-                        "db_path": self.db_path,
-                        "total_records": total,
-                        "today_records": today_count
-                    }
+            start, end = _today_range()
+            with self._reader() as conn:
+                rows = conn.execute(_LIST_TODAY_SQL, (start, end, limit, offset)).fetchall()
+
+            return [_row_to_summary(row) for row in rows]
 
         except Exception as e:
-            self.logger.log("storage", "error", f"获取存储状态失败: {e}")
-            return {
-                "db_path": self.db_path,
-                "total_records": 0,
-                "today_records": 0,
-                "error": str(e)
-            }
+            self.logger.log("storage", "error", f"查询今天记录摘要失败: {e}")
+            return []
+
+    def get_record(self, record_id: int, timestamp: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """获取单条检测记录的完整内容（详情页使用）
+
+        Args:
+            record_id: 记录 ID
+            timestamp: 记录时间戳（可选，提供时直接按主键定位，否则按 id 查找）
+
+        Returns:
+            检测记录（字段同 get_today()），不存在时返回 None
+        """
+        try:
+            with self._reader() as conn:
+                if timestamp is not None:
+                    row = conn.execute(_SELECT_BY_KEY_SQL, (timestamp, record_id)).fetchone()
+                else:
+                    row = conn.execute(_SELECT_BY_ID_SQL, (record_id,)).fetchone()
+
+            return _row_to_record(row) if row is not None else None
+
+        except Exception as e:
+            self.logger.log("storage", "error", f"查询检测记录失败: {e}")
+            return None
+
+    def get_status(self) -> Dict[str, Any]:
+        """获取存储状态（直接读取内存中的记录数，不查询数据库）
+
+        Returns:
+            状态字典
+        """
+        today = date.today()
+        with self._lock:
+            # 跨天后还没有新记录时，今天的计数为 0
+            if today != self._today_date:
+                self._today_date = today
+                self._today_count = 0
+            total = self._total_count
+            today_count = self._today_count
+
+        return {
+            "db_path": self.db_path,
+            "total_records": total,
+            "today_records": today_count
+        }
+
+    def close(self):
+        """写完队列中的记录并关闭数据库连接（程序退出时调用，可重复调用）"""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(_STOP)
+            self._writer_thread.join()
+
+        # 关闭空闲的只读连接（正在使用的连接归还时关闭）
+        while True:
+            try:
+                self._read_pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+                self.logger.log("storage", "info", "数据库连接已关闭")
 
 
 # ==================== 工厂函数 ====================
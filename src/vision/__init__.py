@@ -24,13 +24,16 @@ Vision 模块 - 已重构版本
 │     - switch_to_mode()              │
 │     - capture()                     │
 │     - read_frame()                  │
+│     - read_jpeg()                   │
 └─────────────────────────────────────┘
 """
 
 from .camera_singleton import (
     get_camera_singleton,
     CameraSingleton,
-    CameraMode
+    CameraMode,
+    encode_jpeg,
+    thumbnail_path
 )
 
 from .camera_service import (
@@ -44,6 +47,8 @@ __all__ = [
     'get_camera_singleton',
     'CameraSingleton',
     'CameraMode',
+    'encode_jpeg',
+    'thumbnail_path',
 
     # 配置层
     'CameraServiceConfig',
@@ -18,7 +18,7 @@ from dataclasses import dataclass
 from typing import Optional, Dict, Any
 from pathlib import Path
 
-from src.common import Logger
+from src.common import get_logger
 from src.vision.camera_singleton import CameraSingleton, CameraMode
 
 
@@ -60,15 +60,17 @@ class CameraService:
         """
         self.camera = camera
         self._config = config
-        self.logger = Logger(config.log_dir)
+        self.logger = get_logger(config.log_dir)
 
         # 模式状态
         self._current_mode: Optional[str] = None  # None | 'capture' | 'preview'
         self._preview_client_id: Optional[str] = None
-        self._preview_client_time: Optional[float] = None
+        self._preview_client_time: Optional[float] = None   # 墙上时间（用于展示）
+        self._preview_client_mono: Optional[float] = None   # time.monotonic()（用于超时判断）
 
         # 线程安全锁（保护 stream/capture 切换）
-        self._lock = threading.Lock()
+        # 直接使用硬件层的可重入锁：切换模式 + 截图整体只持有一把锁，不再嵌套两把
+        self._lock = camera.mode_lock
 
         self.logger.log("camera", "info", "CameraService 初始化（硬件层）")
 
@@ -112,6 +114,10 @@ class CameraService:
                 self.logger.log("camera", "error", f"截图异常: {e}")
                 return None
 
+    def flush(self):
+        """等待已截取的图片写入磁盘（读取截图文件之前调用）"""
+        self.camera.flush()
+
     # ==================== 视频预览 ====================
 
     def start_preview(self, client_id: str) -> Dict[str, Any]:
@@ -134,6 +140,7 @@ class CameraService:
             # 更新最后客户端
             self._preview_client_id = client_id
             self._preview_client_time = time.time()
+            self._preview_client_mono = time.monotonic()
 
             self.logger.log("camera", "info", f"客户端 {client_id} 请求启动预览")
 
@@ -171,6 +178,7 @@ class CameraService:
             # 清除客户端信息
             self._preview_client_id = None
             self._preview_client_time = None
+            self._preview_client_mono = None
 
         return {"success": True, "message": "预览模式已停止"}
 
@@ -191,10 +199,11 @@ class CameraService:
         Returns:
             是否超时
         """
-        if self._preview_client_time is None:
+        if self._preview_client_mono is None:
             return True
 
-        elapsed = time.time() - self._preview_client_time
+        # 单调时钟：系统时间被调整（NTP 校时等）时不会误判超时
+        elapsed = time.monotonic() - self._preview_client_mono
         return elapsed > self._config.preview_timeout
 
     def read_preview_frame(self):
@@ -245,6 +254,7 @@ class CameraService:
             self._current_mode = None
             self._preview_client_id = None
             self._preview_client_time = None
+            self._preview_client_mono = None
 
         # 关闭摄像头
         self.camera.shutdown()
@@ -2,6 +2,7 @@
 单例摄像头管理类
 确保全局只有一个摄像头实例，支持模式切换
 """
+import queue
 import threading
 import time
 import cv2
@@ -10,7 +11,51 @@ from typing import Optional, Literal
 from datetime import datetime
 
 from src.common import Config
-from src.common import Logger
+from src.common import get_logger
+
+# 可选：libjpeg-turbo（SIMD 加速的 JPEG 编码），未安装时回退到 cv2.imencode
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR, TJSAMP_420
+    _turbo_jpeg = TurboJPEG()
+except Exception:
+    # 未安装 PyTurboJPEG，或找不到 libturbojpeg 动态库
+    _turbo_jpeg = None
+
+# 截图的 JPEG 质量
+_JPEG_QUALITY = 95
+
+# 缩略图（记录页列表使用）：最大尺寸和 JPEG 质量
+THUMB_SIZE = (320, 240)
+_THUMB_QUALITY = 72
+
+
+def thumbnail_path(image_path: Path) -> Path:
+    """截图对应的缩略图路径：同目录下 thumbs/ 子目录中的同名文件"""
+    return image_path.parent / "thumbs" / image_path.name
+
+
+def make_thumbnail(frame) -> Optional[bytes]:
+    """把 BGR 帧缩小到 THUMB_SIZE 以内（保持宽高比）并编码为 JPEG"""
+    height, width = frame.shape[:2]
+    scale = min(THUMB_SIZE[0] / width, THUMB_SIZE[1] / height, 1.0)
+    if scale < 1.0:
+        # INTER_AREA 适合缩小，不会产生摩尔纹
+        frame = cv2.resize(frame, (max(1, round(width * scale)), max(1, round(height * scale))),
+                           interpolation=cv2.INTER_AREA)
+    return encode_jpeg(frame, _THUMB_QUALITY)
+
+
+def encode_jpeg(frame, quality: int = _JPEG_QUALITY) -> Optional[bytes]:
+    """把 BGR 帧编码为 JPEG
+
+    Returns:
+        JPEG 数据，失败返回 None
+    """
+    if _turbo_jpeg is not None:
+        # 4:2:0 色度采样，与 cv2.imencode 的默认输出一致
+        return _turbo_jpeg.encode(frame, quality=quality, pixel_format=TJPF_BGR, jpeg_subsample=TJSAMP_420)
+    ok, buf = cv2.imencode(".jpg", frame, [int(cv2.IMWRITE_JPEG_QUALITY), quality])
+    return buf.tobytes() if ok else None
 
 
 class CameraMode:
@@ -25,7 +70,7 @@ class CameraSingleton:
     职责：
     1. 硬件管理（打开、关闭摄像头）
     2. 模式管理（截图模式 vs 视频流模式）
-    3. 基本操作（capture、read_frame）
+    3. 基本操作（capture、read_frame、read_jpeg）
     4. 模式切换延迟处理
     """
 
@@ -45,19 +90,35 @@ class CameraSingleton:
             return
 
         self.config = config
-        self.logger = Logger(config.log_dir)
+        self.logger = get_logger(config.log_dir)
         self.cap: Optional[cv2.VideoCapture] = None
         self.mode: Optional[str] = None
-        self.mode_lock = threading.Lock()
+        # 可重入锁：CameraService 直接复用这把锁，在持有时调用 switch_to_mode 等方法
+        self.mode_lock = threading.RLock()
         self.last_frame = None
         self.last_frame_time = None
 
+        # 视频流模式下 cap.read() 是否直接返回摄像头输出的 MJPEG 数据（未解码）
+        self.raw_jpeg = False
+
         # 模式切换配置
         self.switch_delay = 0.5  # 切换模式时的等待时间（秒）
 
         # 项目根目录（用于构建绝对路径）
         self.project_root = Path(__file__).parent.parent.parent
 
+        # 最近一次创建过的截图目录
+        self._last_capture_dir: Optional[Path] = None
+
+        # 后台写盘：capture() 只负责编码，文件由写盘线程写入
+        self._writer_queue: queue.Queue = queue.Queue(maxsize=16)
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop,
+            name="CameraWriter",
+            daemon=True
+        )
+        self._writer_thread.start()
+
         self._initialized = True
         self.logger.log("camera", "info", "单例摄像头管理器创建")
 
@@ -82,6 +143,7 @@ class CameraSingleton:
                 self.cap.release()
                 self.cap = None
                 self.mode = None
+                self.raw_jpeg = False
 
         # 释放锁后等待，避免阻塞其他操作
         if self.mode is not None:
@@ -96,6 +158,10 @@ class CameraSingleton:
                     self.logger.log("camera", "error", f"无法打开摄像头 (索引: {self.config.camera.camera_index})")
                     return False
 
+                # 设置采集格式（例如 MJPG，需在设置分辨率之前）
+                if self.config.camera.fourcc:
+                    self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*self.config.camera.fourcc))
+
                 # 设置分辨率
                 width, height = self.config.camera.resolution
                 self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
@@ -104,6 +170,12 @@ class CameraSingleton:
                 # 设置缓冲区大小
                 self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 
+                # 视频流模式 + MJPG 采集：关闭 RGB 转换，read() 直接返回摄像头编码好的 JPEG
+                # （V4L2 后端支持；截图模式仍然解码，由 encode_jpeg 按截图质量重新编码）
+                self.raw_jpeg = False
+                if target_mode == CameraMode.STREAM and self.config.camera.fourcc.upper() == "MJPG":
+                    self.raw_jpeg = bool(self.cap.set(cv2.CAP_PROP_CONVERT_RGB, 0))
+
                 self.mode = target_mode
                 self.logger.log("camera", "info", f"摄像头切换成功 - 模式: {target_mode}, 索引: {self.config.camera.camera_index}")
                 return True
@@ -139,9 +211,9 @@ class CameraSingleton:
             return None
 
         try:
-            # 清空缓冲区：读取并丢弃2帧
-            for _ in range(2):
-                self.cap.read()
+            # 清空缓冲区：grab() 只取帧不解码，丢弃的旧帧不必付出解码开销
+            for _ in range(self.config.camera.drain_frames):
+                self.cap.grab()
 
             # 读取最新帧（OpenCV 内部线程安全）
             ret, frame = self.cap.read()
@@ -153,16 +225,34 @@ class CameraSingleton:
             if output_path is None:
                 timestamp = datetime.now()
                 output_path = self.project_root / "data" / "captures" / f"{timestamp.strftime('%m%d%Y %H%M%S')}.jpg"
-                output_path.parent.mkdir(parents=True, exist_ok=True)
             else:
                 # 如果是相对路径，转换为绝对路径
                 output_path = Path(output_path)
                 if not output_path.is_absolute():
                     output_path = self.project_root / output_path
-                output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # 保存图像（使用高质量）
-            cv2.imwrite(str(output_path), frame, [int(cv2.IMWRITE_JPEG_QUALITY), 95])
+            # 目录只在第一次用到时创建，之后跳过 mkdir
+            # 连同缩略图的 thumbs/ 子目录一起创建（parents=True 会先创建截图目录）
+            if output_path.parent != self._last_capture_dir:
+                thumbnail_path(output_path).parent.mkdir(parents=True, exist_ok=True)
+                self._last_capture_dir = output_path.parent
+
+            # 编码为 JPEG（使用高质量），写盘交给后台线程
+            data = encode_jpeg(frame)
+            if data is None:
+                self.logger.log("camera", "error", "JPEG 编码失败")
+                return None
+            # 队列满时等待（不丢弃截图）
+            self._writer_queue.put((output_path, data))
+
+            # 同时生成缩略图（帧已在内存中，不必再读取和解码截图文件）
+            # 缩略图失败不影响截图本身，记录页会回退到原图
+            try:
+                thumb_data = make_thumbnail(frame)
+                if thumb_data is not None:
+                    self._writer_queue.put((thumbnail_path(output_path), thumb_data))
+            except Exception as e:
+                self.logger.log("camera", "warning", f"生成缩略图失败: {e}")
 
             self.logger.log("camera", "info", f"捕获图像: {output_path}")
 
@@ -174,6 +264,28 @@ class CameraSingleton:
             self.logger.log("camera", "error", f"捕获图像失败: {e}")
             return None
 
+    def _writer_loop(self):
+        """写盘线程：依次把编码好的 JPEG（截图和缩略图）写入文件"""
+        while True:
+            output_path, data = self._writer_queue.get()
+            try:
+                try:
+                    output_path.write_bytes(data)
+                except FileNotFoundError:
+                    # 目录在运行期间被删除：清除目录缓存，让下一次 capture() 重新创建
+                    # 截图和 thumbs/ 目录，然后为这个文件补建目录再写一次
+                    self._last_capture_dir = None
+                    output_path.parent.mkdir(parents=True, exist_ok=True)
+                    output_path.write_bytes(data)
+            except Exception as e:
+                self.logger.log("camera", "error", f"保存图像失败: {output_path}, {e}")
+            finally:
+                self._writer_queue.task_done()
+
+    def flush(self):
+        """等待所有已捕获的图像写入磁盘"""
+        self._writer_queue.join()
+
     def read_frame(self) -> Optional[tuple]:
         """读取一帧（用于视频流）
 
@@ -190,6 +302,10 @@ class CameraSingleton:
         try:
             ret, frame = self.cap.read()
             if ret:
+                if self.raw_jpeg:
+                    # MJPEG 直通模式下 read() 返回的是 JPEG 数据，解码为 BGR 帧
+                    frame = cv2.imdecode(frame, cv2.IMREAD_COLOR)
+                    ret = frame is not None
                 self.last_frame = frame
                 self.last_frame_time = time.time()
             return ret, frame
@@ -197,8 +313,49 @@ class CameraSingleton:
             self.logger.log("camera", "error", f"读取帧失败: {e}")
             return None
 
+    def read_jpeg(self, quality: int = _JPEG_QUALITY) -> Optional[bytes]:
+        """读取一帧 JPEG 数据（用于视频流）
+
+        摄像头以 MJPG 输出且已关闭 RGB 转换时，直接返回摄像头编码好的 JPEG，
+        省去一次 JPEG 解码和一次重新编码；否则读取 BGR 帧后按 quality 编码。
+
+        Returns:
+            JPEG 数据，失败返回 None
+        """
+        if not self.raw_jpeg:
+            result = self.read_frame()
+            if result is None or not result[0]:
+                return None
+            return encode_jpeg(result[1], quality)
+
+        if self.cap is None or not self.cap.isOpened():
+            return None
+
+        try:
+            ret, buf = self.cap.read()
+        except Exception as e:
+            self.logger.log("camera", "error", f"读取帧失败: {e}")
+            return None
+        if not ret:
+            return None
+
+        data = buf.tobytes()
+        if data[:2] == b"\xff\xd8":
+            self.last_frame_time = time.time()
+            return data
+
+        # 后端不支持直通（返回的仍是解码后的图像）：恢复 RGB 转换，之后走重新编码
+        self.logger.log("camera", "warning", "摄像头不支持 MJPEG 直通，改为重新编码")
+        with self.mode_lock:
+            self.raw_jpeg = False
+            self.cap.set(cv2.CAP_PROP_CONVERT_RGB, 1)
+        return encode_jpeg(buf, quality) if buf.ndim == 3 else None
+
     def shutdown(self):
         """关闭摄像头"""
+        # 先把未写完的截图写入磁盘
+        self.flush()
+
         with self.mode_lock:
             if self.cap:
                 self.cap.release()
@@ -0,0 +1,60 @@
+"""
+SimpleRuleChecker 回归测试
+
+规则检查的结果必须与 re.match(regexp, str(value), re.IGNORECASE) 一致，
+无论是否安装了 Hyperscan。
+
+运行（在项目根目录执行）：
+    python -m unittest discover tests
+"""
+import re
+import tempfile
+import unittest
+
+from src.monitor import SimpleRuleChecker
+
+
+# Unicode 大小写折叠的特殊情况：Hyperscan 的 CASELESS 与 re.IGNORECASE 处理不同
+CASE_FOLD_PATTERNS = [r"^ı$", r"^i$", r"^[A-Z]$", r"^[a-z]+$", r"^\w+$", r"^k$", r"^s+$", r"^(true|false)$"]
+CASE_FOLD_VALUES = ["i", "I", "ı", "İ", "k", "K", "K", "s", "ſ", "ok", "看书", "True", True]
+
+
+class SimpleRuleCheckerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.log_dir = tempfile.mkdtemp()
+
+    def assert_matches_re(self, patterns, values):
+        rules = [{"key": f"k{i}", "regexp": p} for i, p in enumerate(patterns)]
+        checker = SimpleRuleChecker(rules, log_dir=self.log_dir)
+
+        for value in values:
+            analysis = {rule["key"]: value for rule in rules}
+            expected = {rule["key"] for rule in rules
+                        if not re.match(rule["regexp"], str(value), re.IGNORECASE)}
+
+            with self.subTest(value=value):
+                result = checker.check(analysis)
+                self.assertEqual(set(result.failed_fields), expected)
+                self.assertEqual(checker.is_valid(analysis), not expected)
+                batch = checker.check_many([analysis, analysis])
+                self.assertEqual(set(batch[1].failed_fields), expected)
+
+    def test_dotted_and_dotless_i(self):
+        self.assert_matches_re(CASE_FOLD_PATTERNS, CASE_FOLD_VALUES)
+
+    def test_each_pattern_alone(self):
+        # 单条规则时不会与其他规则合并扫描
+        for pattern in CASE_FOLD_PATTERNS:
+            with self.subTest(pattern=pattern):
+                self.assert_matches_re([pattern], CASE_FOLD_VALUES)
+
+    def test_missing_field(self):
+        checker = SimpleRuleChecker([{"key": "at_desk", "regexp": "^true$"}], log_dir=self.log_dir)
+        result = checker.check({})
+        self.assertFalse(result.is_valid)
+        self.assertIn("at_desk", result.failed_fields)
+
+
+if __name__ == "__main__":
+    unittest.main()
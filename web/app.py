@@ -11,17 +11,67 @@ PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from flask import Flask, render_template, jsonify, request, Response, stream_with_context
-import cv2
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.security import safe_join
+from werkzeug.serving import WSGIRequestHandler
+from dotenv import set_key
 import time
 import threading
 import os
-
-from src.monitor import create_simple_monitor_service
+import atexit
+import gzip
+import hashlib
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from src.monitor import create_simple_monitor_service, MonitorConfig
 from src.ai import create_ai_service, AIConfig
-from src.vision import get_camera_singleton, get_camera_service, CameraServiceConfig
+from src.vision import get_camera_singleton, get_camera_service, CameraServiceConfig, thumbnail_path
 from src.messenger import create_messenger_service, MessengerConfig
-from src.storage import get_detection_record_service
-from src.common import Config
+from src.storage import get_detection_record_service, SUMMARY_COLUMNS
+from src.common import Config, get_logger, json_dumps
+
+# 可选：Flask-Caching（未安装时不缓存，每次请求都读取最新数据）
+try:
+    from flask_caching import Cache
+except ImportError:
+    Cache = None
+
+# 可选：orjson 序列化 jsonify 的响应（未安装时使用 Flask 默认的 json）
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 可选：Flask-Compress（未安装时不压缩响应）
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+# 可选：Waitress（生产环境 WSGI 服务器，支持 Windows），未安装时使用 Flask 开发服务器
+try:
+    from waitress import serve as waitress_serve
+except ImportError:
+    waitress_serve = None
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """jsonify 使用 orjson 序列化
+
+    orjson 不支持的类型（如超过 64 位的整数）回退到 Flask 默认实现；
+    orjson 不排序键、不缩进，响应内容不变，只是格式更紧凑
+    """
+
+    def dumps(self, obj, **kwargs):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 
 # 创建 Flask 应用
@@ -29,13 +79,130 @@ app = Flask(__name__,
             template_folder='templates',
             static_folder='static')
 
+if orjson is not None:
+    app.json = FastJSONProvider(app)
+
+# 静态文件允许浏览器缓存 1 小时（过期后用 ETag 条件请求校验）
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 3600
+
+# 截图文件名带时间戳、写入后不再修改，可以长期缓存
+IMAGE_MAX_AGE = 3600
+
+# 由前端服务器直接发送图片文件（零拷贝 sendfile），Python 不读取文件内容：
+# - WEB_USE_X_SENDFILE=true：返回 X-Sendfile 头（Apache mod_xsendfile、lighttpd 等）
+# - WEB_X_ACCEL_CAPTURES=/internal/captures/：返回 X-Accel-Redirect 头（nginx，
+#   需配置 location /internal/captures/ { internal; alias <项目目录>/data/captures/; }）
+# 都不设置时由 Flask 自己发送文件（开发服务器）
+app.config['USE_X_SENDFILE'] = os.getenv("WEB_USE_X_SENDFILE", "").lower() in ("1", "true", "yes")
+X_ACCEL_CAPTURES = os.getenv("WEB_X_ACCEL_CAPTURES", "")
+
+# 文本响应（JSON、页面、CSS/JS）按客户端的 Accept-Encoding 压缩；
+# 图片和 MJPEG 流本身已经压缩，不在列表中
+if Compress is not None:
+    app.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/html', 'text/css',
+                                        'application/javascript', 'text/javascript']
+    app.config['COMPRESS_LEVEL'] = 6
+    app.config['COMPRESS_MIN_SIZE'] = 500
+    Compress(app)
+
+# 带内容哈希（?v=...）的静态文件 URL 可以长期缓存：文件修改后哈希变化，URL 随之改变
+STATIC_VERSIONED_MAX_AGE = 365 * 24 * 3600
+
+# 静态文件内容哈希缓存：{文件名: (修改时间, 哈希)}
+_static_hashes: Dict[str, Tuple[int, str]] = {}
+
+
+def static_file_hash(filename: str) -> Optional[str]:
+    """静态文件的内容哈希（文件修改时间不变时直接返回缓存结果）"""
+    path = Path(app.static_folder) / filename
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    cached_hash = _static_hashes.get(filename)
+    if cached_hash is None or cached_hash[0] != mtime_ns:
+        digest = hashlib.blake2b(path.read_bytes(), digest_size=6).hexdigest()
+        cached_hash = _static_hashes[filename] = (mtime_ns, digest)
+    return cached_hash[1]
+
+
+@app.url_defaults
+def add_static_version(endpoint, values):
+    """url_for('static', ...) 自动加上 ?v=<内容哈希>"""
+    if endpoint == 'static' and 'v' not in values:
+        digest = static_file_hash(values.get('filename', ''))
+        if digest is not None:
+            values['v'] = digest
+
+
+@app.after_request
+def cache_versioned_static(response):
+    """带版本号的静态文件请求：允许浏览器长期缓存，不再发条件请求"""
+    if request.endpoint == 'static' and 'v' in request.args and response.status_code == 200:
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = STATIC_VERSIONED_MAX_AGE
+        response.cache_control.immutable = True
+    return response
+
+# 监控配置文件（绝对路径，不依赖启动时的工作目录）
+CONFIG_FILE = str(PROJECT_ROOT / "config" / "monitor_config.json")
+
+# 截图目录（/image 只允许访问这个目录下的文件）
+CAPTURES_DIR = PROJECT_ROOT / "data" / "captures"
+
 # 全局变量
 monitor_service = None
 services = {}
-preview_active = False  # 是否在预览阶段
-preview_start_time = None  # 预览开始时间
-preview_duration = 10  # 预览持续时间（秒）
-preview_lock = threading.Lock()
+logger = get_logger(PROJECT_ROOT / "logs")
+
+
+@dataclass(frozen=True, slots=True)
+class PreviewState:
+    """预览状态快照
+
+    不可变对象，修改时整体替换 preview_state：读取方直接读取当前引用，不需要加锁
+    """
+    active: bool = False      # 是否在预览阶段
+    start: float = 0.0        # 预览开始时间（time.monotonic()，不受系统时间调整影响）
+    duration: float = 0.0     # 预览持续时间（秒）
+
+    def remaining(self) -> float:
+        """剩余预览时间（秒），未激活或已超时返回 0"""
+        if not self.active:
+            return 0.0
+        return max(0.0, self.duration - (time.monotonic() - self.start))
+
+
+preview_state = PreviewState()
+preview_lock = threading.Lock()  # 只在修改 preview_state 时使用
+
+# 路由中的阻塞 IO（例如消息测试的网络请求）交给线程池并行执行
+io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="WebIO")
+MESSENGER_TEST_TIMEOUT = 120  # 消息测试等待发送结果的最长时间（秒，大于适配器内部各请求超时之和）
+
+# ==================== 响应缓存 ====================
+# 页面轮询的只读接口在进程内缓存几秒，重复请求直接返回内存中的响应
+
+cache = Cache(app, config={
+    "CACHE_TYPE": "SimpleCache",
+    "CACHE_DEFAULT_TIMEOUT": 5
+}) if Cache is not None else None
+
+
+def cached(timeout: int):
+    """缓存 GET 路由的响应（未安装 Flask-Caching 时原样返回视图函数）"""
+    def decorator(view):
+        return cache.cached(timeout=timeout)(view) if cache is not None else view
+    return decorator
+
+
+def clear_config_cache():
+    """配置修改后清除配置页和配置接口的缓存"""
+    if cache is not None:
+        cache.delete("view//config")
+        cache.delete("view//api/config")
 
 
 def init_services():
@@ -46,7 +213,7 @@ def init_services():
         return monitor_service
 
     # 创建必要的目录结构
-    (PROJECT_ROOT / "data" / "captures").mkdir(parents=True, exist_ok=True)
+    CAPTURES_DIR.mkdir(parents=True, exist_ok=True)
     (PROJECT_ROOT / "logs").mkdir(parents=True, exist_ok=True)
     (PROJECT_ROOT / "config").mkdir(parents=True, exist_ok=True)
 
@@ -82,15 +249,16 @@ def init_services():
 
     # 4. Storage 服务
     storage_service = get_detection_record_service(db_path=str(PROJECT_ROOT / "data" / "detection_records.db"))
+    # 退出时关闭数据库长连接
+    atexit.register(storage_service.close)
 
     # 5. Monitor 服务
-    config_file = str(PROJECT_ROOT / "config" / "monitor_config.json")
     monitor_service = create_simple_monitor_service(
         vision_analyzer=vision_analyzer,
         messenger_service=messenger_service,
         camera_service=camera_service,
         storage_service=storage_service,
-        config_file=config_file
+        config_file=CONFIG_FILE
     )
 
     services = {
@@ -109,12 +277,17 @@ def init_services():
     return monitor_service
 
 
+# 导入时初始化服务（只执行一次），路由直接使用 monitor_service / services，
+# 请求处理中不再调用 init_services()
+init_services()
+
+
 # ==================== 页面路由 ====================
 
 @app.route('/')
 def index():
     """主页 - 显示系统状态"""
-    monitor = init_services()
+    monitor = monitor_service
     status = monitor.get_status()
 
     return render_template('index.html',
@@ -124,12 +297,11 @@ def index():
 
 
 @app.route('/config')
+@cached(timeout=30)
 def config_page():
     """配置页面"""
-    # 直接从配置文件加载（确保显示最新的配置）
-    from src.monitor import MonitorConfig
-    config_file = str(PROJECT_ROOT / "config" / "monitor_config.json")
-    config = MonitorConfig.load(config_file)
+    # 直接从配置文件加载（确保显示最新的配置；文件未变化时 load 直接使用缓存的解析结果）
+    config = MonitorConfig.load(CONFIG_FILE)
 
     return render_template('config.html',
                          rules=config.rules,
@@ -144,10 +316,41 @@ def config_page():
                          enable_time_scheduler=config.enable_time_scheduler)
 
 
+# 没有模板变量的页面：第一次请求时渲染，之后直接返回缓存的 HTML（和 ETag）
+_static_pages: Dict[str, Tuple[bytes, bytes, str]] = {}
+
+
+def render_static_page(template: str) -> Response:
+    """返回不依赖请求数据的页面（模板只渲染一次，浏览器缓存未变化时返回 304）"""
+    # 开发模式下模板会自动重新加载，不缓存
+    if app.jinja_env.auto_reload:
+        return Response(render_template(template), mimetype='text/html')
+
+    cached_page = _static_pages.get(template)
+    if cached_page is None:
+        body = render_template(template).encode('utf-8')
+        # 页面内容固定，只在第一次渲染时按最高压缩级别压缩一次
+        gzip_body = gzip.compress(body, compresslevel=9, mtime=0)
+        etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+        cached_page = _static_pages[template] = (body, gzip_body, etag)
+
+    body, gzip_body, etag = cached_page
+    if request.accept_encodings['gzip'] > 0:
+        # 已带 Content-Encoding 的响应 Flask-Compress 不会再次压缩
+        response = Response(gzip_body, mimetype='text/html')
+        response.headers['Content-Encoding'] = 'gzip'
+        etag += '-gz'
+    else:
+        response = Response(body, mimetype='text/html')
+    response.vary.add('Accept-Encoding')
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+
 @app.route('/records')
 def records_page():
     """记录页面"""
-    return render_template('records.html')
+    return render_static_page('records.html')
 
 
 @app.route('/messenger_test')
@@ -162,25 +365,72 @@ def messenger_test_page():
 
 # ==================== API 接口 ====================
 
+# 最近一次序列化的状态：(版本号, 状态 JSON)，同一版本的状态只序列化一次
+_status_json: Tuple[int, str] = (-1, "")
+
+# 进程启动标识：服务重启后状态版本号从头计数，ETag 需要区分
+_STATUS_ETAG_PREFIX = f"{os.getpid():x}-{time.time_ns():x}"
+
+
+def status_json(version: int, status: Dict) -> str:
+    """把指定版本的状态序列化为 JSON（多个客户端共享同一份结果）"""
+    global _status_json
+    cached_json = _status_json
+    if cached_json[0] != version:
+        cached_json = _status_json = (version, json_dumps(status))
+    return cached_json[1]
+
+
 @app.route('/api/status', methods=['GET'])
 def get_status():
-    """获取系统状态"""
-    monitor = init_services()
-    status = monitor.get_status()
+    """获取系统状态（状态未变化时返回 304）"""
+    monitor = monitor_service
+    version, status = monitor.get_status_versioned()
 
-    return jsonify({
-        "success": True,
-        "data": status
-    })
+    etag = f"{_STATUS_ETAG_PREFIX}-{version:x}"
+    if etag in request.if_none_match:
+        response = Response(status=304)
+    else:
+        body = '{"success":true,"data":' + status_json(version, status) + '}'
+        response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.no_cache = True
+    return response
+
+
+# 状态推送没有变化时发送保活注释的间隔（秒），避免代理断开空闲连接
+STATUS_EVENTS_KEEPALIVE = 30
+
+
+@app.route('/api/events', methods=['GET'])
+def status_events():
+    """状态变化推送（Server-Sent Events）
+
+    连接后立即推送一次当前状态，之后只在状态变化时推送，
+    页面不必定时轮询 /api/status
+    """
+    monitor = monitor_service
+
+    def generate():
+        version = -1
+        while True:
+            new_version, status = monitor.wait_status(version, STATUS_EVENTS_KEEPALIVE)
+            if new_version == version:
+                yield ": keepalive\n\n"
+                continue
+            version = new_version
+            yield f"data: {status_json(version, status)}\n\n"
+
+    return Response(generate(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 
 @app.route('/api/config', methods=['GET'])
+@cached(timeout=30)
 def get_config():
     """获取配置"""
-    # 直接从配置文件加载（确保返回最新的配置）
-    from src.monitor import MonitorConfig
-    config_file = "config/monitor_config.json"
-    config = MonitorConfig.load(config_file)
+    # 直接从配置文件加载（确保返回最新的配置；文件未变化时 load 直接使用缓存的解析结果）
+    config = MonitorConfig.load(CONFIG_FILE)
 
     return jsonify({
         "success": True,
@@ -200,7 +450,7 @@ def update_config():
         ...
     }
     """
-    monitor = init_services()
+    monitor = monitor_service
 
     try:
         data = request.get_json()
@@ -208,6 +458,9 @@ def update_config():
         # 更新配置（会自动保存到文件）
         monitor.update_config(**data)
 
+        # 配置接口从文件读取：文件已经更新，清除缓存的旧响应
+        clear_config_cache()
+
         return jsonify({
             "success": True,
             "message": "配置已更新"
@@ -229,7 +482,7 @@ def test_messenger():
         "recipient_id": "userid"
     }
     """
-    monitor = init_services()
+    monitor = monitor_service
     messenger = monitor.messenger
 
     try:
@@ -256,19 +509,21 @@ Time: {time.strftime('%Y-%m-%d %H:%M:%S')}"""
 
         # 查找测试图片
         test_image = None
-        captures_dir = PROJECT_ROOT / "data" / "captures"
-
-        print(f"[DEBUG] captures_dir: {captures_dir}, exists: {captures_dir.exists()}")
-
-        if captures_dir.exists():
-            images = list(captures_dir.glob("*.jpg"))
-            print(f"[DEBUG] 找到 {len(images)} 张图片")
-            if images:
-                # 使用最新的一张图片（按修改时间排序）
-                test_image = str(sorted(images, key=lambda x: x.stat().st_mtime)[-1])
-                print(f"[DEBUG] 选择的图片: {test_image}, exists: {Path(test_image).exists()}")
-
-        if not test_image or not Path(test_image).exists():
+        captures_dir = CAPTURES_DIR
+
+        # 使用最新的一张图片：一次 scandir 遍历取修改时间最大的文件，
+        # DirEntry.stat() 会缓存结果，不必排序
+        # （文件名是"月日年 时分秒"格式，不能按字典序比较）
+        try:
+            with os.scandir(captures_dir) as entries:
+                latest = max((e for e in entries if e.name.endswith('.jpg') and e.is_file()),
+                             key=lambda e: e.stat().st_mtime, default=None)
+            test_image = latest.path if latest is not None else None
+        except FileNotFoundError:
+            pass
+        logger.log("web", "debug", f"captures_dir: {captures_dir}, 选择的图片: {test_image}")
+
+        if not test_image:
             return jsonify({
                 "success": False,
                 "message": "没有可用的测试图片，请先运行监控生成截图"
@@ -290,15 +545,13 @@ Time: {time.strftime('%Y-%m-%d %H:%M:%S')}"""
                 "message": "企业微信适配器未配置"
             }), 400
 
-        # 发送文本消息
-        print(f"[DEBUG] 准备发送文本消息到: {recipient_id}")
-        text_success = wechat_adapter.send_text(text_message, recipient_id)
-        print(f"[DEBUG] 文本消息发送结果: {text_success}")
-
-        # 发送图片消息
-        print(f"[DEBUG] 准备发送图片: {test_image}")
-        image_success = wechat_adapter.send_image(test_image, recipient_id)
-        print(f"[DEBUG] 图片消息发送结果: {image_success}")
+        # 文本和图片是两个独立的请求，并行发送
+        logger.log("web", "debug", f"准备发送文本消息和图片到: {recipient_id}, 图片: {test_image}")
+        text_future = io_pool.submit(wechat_adapter.send_text, text_message, recipient_id)
+        image_future = io_pool.submit(wechat_adapter.send_image, test_image, recipient_id)
+        text_success = text_future.result(timeout=MESSENGER_TEST_TIMEOUT)
+        image_success = image_future.result(timeout=MESSENGER_TEST_TIMEOUT)
+        logger.log("web", "debug", f"发送结果: 文本 {text_success}, 图片 {image_success}")
 
         return jsonify({
             "success": True,
@@ -346,31 +599,16 @@ def save_recipients():
                 "message": ".env 文件不存在"
             }), 400
 
-        with open(env_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-
-        # 查找并修改 WECHAT_TOUSER 行
-        found = False
-        for i, line in enumerate(lines):
-            if line.startswith('WECHAT_TOUSER='):
-                lines[i] = f'WECHAT_TOUSER={recipients}\n'
-                found = True
-                break
-
-        # 如果没找到，添加新行
-        if not found:
-            lines.append(f'WECHAT_TOUSER={recipients}\n')
-
-        # 写回文件
-        with open(env_path, 'w', encoding='utf-8') as f:
-            f.writelines(lines)
+        # 修改（或追加）WECHAT_TOUSER 行：写入临时文件后替换，写到一半崩溃也不会损坏 .env
+        set_key(str(env_path), 'WECHAT_TOUSER', recipients, quote_mode='never')
 
         # 更新环境变量（当前进程）
+        changed = os.environ.get('WECHAT_TOUSER') != recipients
         os.environ['WECHAT_TOUSER'] = recipients
 
-        # 重新初始化 messenger 服务
+        # 收件人有变化时才重新初始化 messenger 服务
         global services, monitor_service
-        if monitor_service:
+        if monitor_service and changed:
             from src.messenger import create_messenger_service, MessengerConfig
             messenger_config = MessengerConfig(
                 wechat_corpid=os.getenv("WECHAT_CORPID", ""),
@@ -405,8 +643,8 @@ def save_recipients():
 @app.route('/api/monitor/start', methods=['POST'])
 def start_monitor():
     """启动监控"""
-    global preview_active, preview_start_time, preview_duration
-    monitor = init_services()
+    global preview_state
+    monitor = monitor_service
 
     try:
         result = monitor.start_monitor()
@@ -419,9 +657,7 @@ def start_monitor():
             if monitor.config.enable_preview and duration > 0:
                 # 立即激活预览状态（monitor 的预览在后台线程中启动）
                 with preview_lock:
-                    preview_active = True
-                    preview_start_time = time.time()
-                    preview_duration = duration
+                    preview_state = PreviewState(True, time.monotonic(), duration)
                 print(f"[预览] 预览已激活，持续 {duration} 秒")
 
                 return jsonify({
@@ -451,8 +687,8 @@ def start_monitor():
 @app.route('/api/monitor/stop', methods=['POST'])
 def stop_monitor():
     """停止监控"""
-    global preview_active
-    monitor = init_services()
+    global preview_state
+    monitor = monitor_service
 
     try:
         result = monitor.stop_monitor()
@@ -460,7 +696,7 @@ def stop_monitor():
         if result:
             # 停止预览
             with preview_lock:
-                preview_active = False
+                preview_state = PreviewState()
 
             return jsonify({
                 "success": True,
@@ -480,71 +716,41 @@ def stop_monitor():
 
 
 @app.route('/api/records/today', methods=['GET'])
+@cached(timeout=5)
 def get_today_records():
     """获取今天的检测记录"""
-    import sqlite3
-    from datetime import datetime
-
-    # 获取今天的日期（YYYY-MM-DD 格式）
-    today = datetime.now().strftime('%Y-%m-%d')
-
-    conn = sqlite3.connect(str(PROJECT_ROOT / "data" / "detection_records.db"))
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-
-    # 查询今天的记录
-    cursor.execute("""
-        SELECT * FROM detection_records
-        WHERE DATE(timestamp) = ?
-        ORDER BY timestamp DESC
-    """, (today,))
-
-    rows = cursor.fetchall()
-    records = [dict(row) for row in rows]
-
-    conn.close()
+    # 存储服务为每个线程复用同一个只读连接，不再每次请求重新打开数据库
+    rows = services["storage"].get_today_rows()
 
+    # 按列返回：字段名只出现一次（columns），每条记录是与之对应的数组
     return jsonify({
         "success": True,
-        "data": records,
-        "count": len(records)
+        "columns": SUMMARY_COLUMNS,
+        "data": rows,
+        "count": len(rows)
     })
 
 
 @app.route('/api/records/recent', methods=['GET'])
+@cached(timeout=5)
 def get_recent_records():
     """获取最近的检测记录"""
-    monitor = init_services()
-
     # 获取最近 10 条记录
-    import sqlite3
-    conn = sqlite3.connect(str(PROJECT_ROOT / "data" / "detection_records.db"))
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        SELECT * FROM detection_records
-        ORDER BY timestamp DESC
-        LIMIT 10
-    """)
-
-    rows = cursor.fetchall()
-    records = [dict(row) for row in rows]
-
-    conn.close()
+    rows = services["storage"].get_recent_rows(10)
 
+    # 按列返回：字段名只出现一次（columns），每条记录是与之对应的数组
     return jsonify({
         "success": True,
-        "data": records,
-        "count": len(records)
+        "columns": SUMMARY_COLUMNS,
+        "data": rows,
+        "count": len(rows)
     })
 
 
 @app.route('/image')
 def serve_image():
-    """提供检测图片"""
+    """提供检测图片（thumb=1 时返回缩略图，缩略图不存在时返回原图）"""
     from flask import send_file
-    import os
 
     image_path = request.args.get('path')
 
@@ -559,19 +765,48 @@ def serve_image():
     if '..' in normalized_path or not normalized_path.startswith('data/captures/'):
         return "Invalid path", 403
 
-    # 使用项目根目录构建完整路径
-    full_path = PROJECT_ROOT / image_path
+    # safe_join 再做一次校验（拒绝绝对路径、驱动器号等），得到 captures 目录下的完整路径
+    relative_path = normalized_path[len('data/captures/'):]
+    joined = safe_join(str(CAPTURES_DIR), relative_path)
+    if joined is None:
+        return "Invalid path", 403
+    full_path = Path(joined)
+
+    # 缩略图在截图时生成；旧截图没有缩略图，使用原图
+    if request.args.get('thumb'):
+        thumb_path = thumbnail_path(full_path)
+        if thumb_path.is_file():
+            full_path = thumb_path
+            relative_path = thumb_path.relative_to(CAPTURES_DIR).as_posix()
 
-    if not os.path.exists(full_path):
+    try:
+        stat = full_path.stat()
+    except OSError:
         print(f"[图片] 文件不存在: {full_path}")
         return "Image not found", 404
 
-    try:
-        print(f"[图片] 提供文件: {full_path}")
-        return send_file(full_path, mimetype='image/jpeg')
-    except Exception as e:
-        print(f"[图片] 错误: {e}")
-        return f"Error: {str(e)}", 500
+    # 浏览器已缓存同一文件时直接返回 304，不读取文件
+    etag = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+    if etag in request.if_none_match:
+        response = Response(status=304)
+        response.set_etag(etag)
+    elif X_ACCEL_CAPTURES:
+        # nginx 内部重定向：图片由 nginx 直接从磁盘发送
+        response = Response(mimetype='image/jpeg')
+        response.headers['X-Accel-Redirect'] = X_ACCEL_CAPTURES + relative_path
+        response.set_etag(etag)
+    else:
+        try:
+            print(f"[图片] 提供文件: {full_path}")
+            response = send_file(full_path, mimetype='image/jpeg', etag=etag, max_age=IMAGE_MAX_AGE)
+        except Exception as e:
+            print(f"[图片] 错误: {e}")
+            return f"Error: {str(e)}", 500
+
+    response.cache_control.public = True
+    response.cache_control.max_age = IMAGE_MAX_AGE
+    response.cache_control.immutable = True
+    return response
 
 
 # ==================== 预览视频流 ====================
@@ -579,128 +814,186 @@ def serve_image():
 @app.route('/api/preview/status', methods=['GET'])
 def get_preview_status():
     """获取预览状态"""
-    global preview_active, preview_start_time, preview_duration
+    remaining = preview_state.remaining()
 
-    with preview_lock:
-        if not preview_active or preview_start_time is None:
-            return jsonify({
-                "success": True,
-                "active": False,
-                "remaining": 0
-            })
+    return jsonify({
+        "success": True,
+        "active": remaining > 0,
+        "remaining": round(remaining, 1)
+    })
 
-        elapsed = time.time() - preview_start_time
-        remaining = max(0, preview_duration - elapsed)
 
-        # 如果超时，自动停止预览
-        if elapsed >= preview_duration:
-            preview_active = False
-            return jsonify({
-                "success": True,
-                "active": False,
-                "remaining": 0
-            })
+def _preview_is_active() -> bool:
+    """预览是否仍在进行（超时即视为结束，不需要修改状态）"""
+    return preview_state.remaining() > 0
+
+
+# 预览帧的 JPEG 质量（预览只需看清画面，比截图的质量低）
+PREVIEW_JPEG_QUALITY = 80
+
+# MJPEG 流中每一帧的分段头和结尾
+_MJPEG_HEADER = b'--frame\r\nContent-Type: image/jpeg\r\n\r\n'
+_MJPEG_TAIL = b'\r\n'
 
-        return jsonify({
-            "success": True,
-            "active": True,
-            "remaining": round(remaining, 1)
-        })
+
+class PreviewBroadcaster:
+    """预览帧广播器
+
+    由一个后台线程读取并编码摄像头帧，所有 /video_feed 连接共享同一份 MJPEG 分段数据，
+    编码和拼接开销与观看人数无关，多个连接也不会争抢摄像头。
+    """
+
+    def __init__(self):
+        self.cond = threading.Condition()
+        self.latest_chunk: Optional[bytes] = None   # 最新一帧的完整 MJPEG 分段（头 + JPEG + 结尾）
+        self.seq = 0               # 帧序号，每编码一帧加 1（也是累计帧数，/metrics 导出）
+        self.viewers = 0           # 当前观看连接数
+        self.running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, camera_singleton):
+        """启动广播线程（已在运行时什么都不做）"""
+        with self.cond:
+            if self.running:
+                return
+            self.running = True
+            self.latest_chunk = None
+
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(camera_singleton,),
+            name="PreviewBroadcaster",
+            daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, camera_singleton):
+        """广播循环：预览结束后自动退出"""
+        logger.log("web", "info", f"预览广播开始，摄像头模式: {camera_singleton.get_mode()}")
+        try:
+            while _preview_is_active():
+                # 检查摄像头是否在 STREAM 模式（monitor 的预览模式）
+                if camera_singleton.get_mode() != "stream":
+                    logger.log("web", "debug", f"摄像头不在 stream 模式，当前模式: {camera_singleton.get_mode()}")
+                    time.sleep(0.5)
+                    continue
+
+                # 直接从摄像头读取 JPEG 帧（不调用 start_preview，因为 monitor 已经启动了）
+                # 摄像头输出 MJPEG 时直接转发，不再解码后重新编码
+                frame_bytes = camera_singleton.read_jpeg(PREVIEW_JPEG_QUALITY)
+                if frame_bytes is None:
+                    logger.log("web", "debug", "预览读取帧失败")
+                    time.sleep(0.5)
+                    continue
+
+                # 每帧只拼接一次，所有连接直接发送同一个 bytes 对象
+                chunk = b''.join((_MJPEG_HEADER, frame_bytes, _MJPEG_TAIL))
+
+                with self.cond:
+                    self.latest_chunk = chunk
+                    self.seq += 1
+                    self.cond.notify_all()
+
+                # 控制帧率（约 10 FPS）
+                time.sleep(0.1)
+
+        except Exception as e:
+            logger.log("web", "error", f"预览广播异常: {e}")
+
+        finally:
+            with self.cond:
+                self.running = False
+                self.cond.notify_all()
+            logger.log("web", "info", "预览广播结束")
+
+    def wait_frame(self, last_seq: int, timeout: float = 1.0) -> Tuple[int, Optional[bytes]]:
+        """等待比 last_seq 更新的帧
+
+        Returns:
+            (帧序号, MJPEG 分段数据)；超时或广播已停止时序号不变
+        """
+        with self.cond:
+            self.cond.wait_for(lambda: self.seq != last_seq or not self.running, timeout)
+            return self.seq, self.latest_chunk
+
+
+preview_broadcaster = PreviewBroadcaster()
 
 
 def generate_preview_frames():
     """生成预览视频帧（MJPEG 流）
 
-    注意：不启动新的预览，而是在 monitor 预览期间读取帧
+    注意：不启动新的预览，而是在 monitor 预览期间读取帧；
+    帧由 PreviewBroadcaster 统一读取和编码，这里只负责转发
     """
-    global preview_active, preview_start_time, preview_duration
-
-    monitor = init_services()
     camera_service = services.get("camera")
 
     if not camera_service:
-        print("[视频流] camera_service 不存在")
+        logger.log("web", "error", "预览失败: camera_service 不存在")
         return
 
     # camera_service 是 CameraService，获取底层的 CameraSingleton
     camera_singleton = camera_service.camera if hasattr(camera_service, 'camera') else None
     if not camera_singleton:
-        print("[视频流] camera_singleton 不存在")
+        logger.log("web", "error", "预览失败: camera_singleton 不存在")
         return
 
-    print(f"[视频流] 开始生成帧，摄像头模式: {camera_singleton.get_mode()}")
+    preview_broadcaster.start(camera_singleton)
 
+    with preview_broadcaster.cond:
+        preview_broadcaster.viewers += 1
+        # 帧序号在多次预览之间持续累加：从当前序号开始等待，
+        # 本次预览已有帧时先发送最新的一帧
+        last_seq = preview_broadcaster.seq
+        if preview_broadcaster.latest_chunk is not None:
+            last_seq -= 1
     try:
-        frame_count = 0
-        while True:
-            # 检查预览是否仍然活跃
-            with preview_lock:
-                if not preview_active or preview_start_time is None:
-                    print(f"[视频流] 预览未激活，停止流")
+        while _preview_is_active():
+            seq, chunk = preview_broadcaster.wait_frame(last_seq)
+            if seq == last_seq:
+                if not preview_broadcaster.running:
                     break
-
-                elapsed = time.time() - preview_start_time
-                if elapsed >= preview_duration:
-                    print(f"[视频流] 预览超时 ({elapsed:.1f}s >= {preview_duration}s)，停止流")
-                    preview_active = False
-                    break
-
-            # 检查摄像头是否在 STREAM 模式（monitor 的预览模式）
-            if camera_singleton.get_mode() != "stream":
-                print(f"[视频流] 摄像头不在 stream 模式，当前模式: {camera_singleton.get_mode()}")
-                time.sleep(0.5)
-                continue
-
-            # 直接从摄像头读取帧（不调用 start_preview，因为 monitor 已经启动了）
-            frame_result = camera_singleton.read_frame()
-            if frame_result is None:
-                print("[视频流] 读取帧失败，frame_result is None")
-                time.sleep(0.5)
                 continue
-
-            ret, frame = frame_result
-            if not ret:
-                print("[视频流] 读取帧失败，ret is False")
-                time.sleep(0.5)
-                continue
-
-            frame_count += 1
-            if frame_count % 30 == 0:  # 每 3 秒打印一次
-                print(f"[视频流] 已发送 {frame_count} 帧")
-
-            # 编码为 JPEG
-            ret, buffer = cv2.imencode('.jpg', frame)
-            if not ret:
-                print("[视频流] JPEG 编码失败")
+            last_seq = seq
+            if chunk is None:
                 continue
 
-            # 生成帧数据
-            frame_bytes = buffer.tobytes()
-            yield (b'--frame\r\n'
-                   b'Content-Type: image/jpeg\r\n\r\n' + frame_bytes + b'\r\n')
-
-            # 控制帧率（约 10 FPS）
-            time.sleep(0.1)
-
-    except Exception as e:
-        print(f"[视频流] 异常: {e}")
-        import traceback
-        traceback.print_exc()
+            yield chunk
+    finally:
+        # 客户端断开时生成器被关闭，同样会执行到这里
+        with preview_broadcaster.cond:
+            preview_broadcaster.viewers -= 1
 
 
 @app.route('/video_feed')
 def video_feed():
     """视频流端点（仅预览阶段可用）"""
-    global preview_active
-
-    with preview_lock:
-        if not preview_active:
-            return Response(status=403, response="预览未激活")
+    if not _preview_is_active():
+        return Response(status=403, response="预览未激活")
 
     return Response(stream_with_context(generate_preview_frames()),
                     mimetype='multipart/x-mixed-replace; boundary=frame')
 
 
+# ==================== 运行指标 ====================
+
+@app.route('/metrics')
+def metrics():
+    """运行指标（Prometheus 文本格式）"""
+    lines = [
+        "# HELP preview_frames_total 预览广播累计编码（或直通）的帧数",
+        "# TYPE preview_frames_total counter",
+        f"preview_frames_total {preview_broadcaster.seq}",
+        "# HELP preview_viewers 当前预览视频流连接数",
+        "# TYPE preview_viewers gauge",
+        f"preview_viewers {preview_broadcaster.viewers}",
+        "# HELP preview_active 是否在预览阶段",
+        "# TYPE preview_active gauge",
+        f"preview_active {int(_preview_is_active())}",
+    ]
+    return Response("\n".join(lines) + "\n", mimetype="text/plain; version=0.0.4")
+
+
 # ==================== 错误处理 ====================
 
 @app.errorhandler(404)
@@ -721,9 +1014,24 @@ def internal_error(error):
 
 # ==================== 启动命令 ====================
 
-if __name__ == '__main__':
-    # 初始化服务
-    init_services()
+class NoDelayRequestHandler(WSGIRequestHandler):
+    """开发服务器的请求处理器：关闭 Nagle 算法
 
-    # 启动 Flask 应用
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    MJPEG 每帧最后一个不满 MSS 的数据段立即发送，不必等待上一段的 ACK，
+    避免与客户端延迟确认叠加造成的预览卡顿。
+    """
+    disable_nagle_algorithm = True
+
+
+if __name__ == '__main__':
+    # WEB_DEBUG=true 时使用 Flask 开发服务器（调试模式）
+    # 关闭自动重载：重载器会再启动一个进程重新导入本模块，摄像头和监控服务被初始化两次
+    web_debug = os.getenv("WEB_DEBUG", "false").lower() == "true"
+
+    if not web_debug and waitress_serve is not None:
+        # Waitress：多线程 WSGI 服务器，预览视频流和其他接口各占一个线程
+        logger.log("web", "info", "使用 Waitress 启动 Web 服务")
+        waitress_serve(app, host='0.0.0.0', port=5000, threads=16, channel_timeout=120)
+    else:
+        app.run(host='0.0.0.0', port=5000, debug=web_debug, use_reloader=False,
+                threaded=True, request_handler=NoDelayRequestHandler)
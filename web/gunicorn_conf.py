@@ -0,0 +1,30 @@
+"""
+Gunicorn 配置 - 生产环境部署
+
+启动（在项目根目录执行）：
+    gunicorn -c web/gunicorn_conf.py web.app:app
+
+说明：
+- 只能使用 1 个 worker 进程：摄像头、监控服务和数据库写入线程都是进程内单例，
+  多个进程会同时打开摄像头、重复截图和发送通知
+- 使用 gthread 线程 worker：每个请求（包括长时间的 MJPEG 预览流）占用一个线程，
+  预览期间其他接口照常响应；摄像头和 SQLite 都是阻塞调用，不适合 gevent 协程
+- 不开启 preload_app：服务在导入 app 时启动后台线程，线程不会随 fork 复制到 worker，
+  必须在 worker 进程内导入
+"""
+
+bind = "0.0.0.0:5000"
+
+workers = 1
+worker_class = "gthread"
+threads = 16             # 同时处理的请求数（每个预览观看者占用一个）
+
+# gthread worker 的超时只检查 worker 心跳，不会中断长时间的视频流
+timeout = 60
+graceful_timeout = 10
+keepalive = 5
+
+preload_app = False
+
+accesslog = "-"
+errorlog = "-"
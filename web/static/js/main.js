@@ -2,6 +2,23 @@
 
 let previewTimer = null;  // 预览定时器
 
+// 显示状态
+function renderStatus(status) {
+    // 更新监控状态
+    const monitoringStatus = document.getElementById('monitoring-status');
+    monitoringStatus.innerHTML = status.is_monitoring
+        ? '<span class="badge badge-success">运行中</span>'
+        : '<span class="badge badge-secondary">已停止</span>';
+
+    // 更新连续失败次数
+    document.getElementById('consecutive-failures').textContent = status.consecutive_failures;
+    document.getElementById('fail-limit').textContent = status.notify_manager.consecutive_fail_limit;
+
+    // 更新按钮状态
+    document.getElementById('btn-start').disabled = status.is_monitoring;
+    document.getElementById('btn-stop').disabled = !status.is_monitoring;
+}
+
 // 刷新状态
 async function refreshStatus() {
     try {
@@ -9,21 +26,7 @@ async function refreshStatus() {
         const result = await response.json();
 
         if (result.success) {
-            const status = result.data;
-
-            // 更新监控状态
-            const monitoringStatus = document.getElementById('monitoring-status');
-            monitoringStatus.innerHTML = status.is_monitoring
-                ? '<span class="badge badge-success">运行中</span>'
-                : '<span class="badge badge-secondary">已停止</span>';
-
-            // 更新连续失败次数
-            document.getElementById('consecutive-failures').textContent = status.consecutive_failures;
-            document.getElementById('fail-limit').textContent = status.notify_manager.consecutive_fail_limit;
-
-            // 更新按钮状态
-            document.getElementById('btn-start').disabled = status.is_monitoring;
-            document.getElementById('btn-stop').disabled = !status.is_monitoring;
+            renderStatus(result.data);
         }
     } catch (error) {
         console.error('刷新状态失败:', error);
@@ -174,6 +177,15 @@ document.addEventListener('DOMContentLoaded', function() {
     document.getElementById('btn-stop').addEventListener('click', stopMonitor);
     document.getElementById('btn-refresh').addEventListener('click', refreshStatus);
 
-    // 定时刷新状态（每 5 秒）
-    setInterval(refreshStatus, 5000);
+    // 订阅状态推送（状态变化时服务器主动推送，断线后浏览器自动重连）
+    if (window.EventSource) {
+        const source = new EventSource('/api/events');
+        source.onmessage = (e) => renderStatus(JSON.parse(e.data));
+
+        // 兜底：每 60 秒刷新一次
+        setInterval(refreshStatus, 60000);
+    } else {
+        // 不支持 EventSource 的浏览器：定时刷新状态（每 5 秒）
+        setInterval(refreshStatus, 5000);
+    }
 });
@@ -7,7 +7,7 @@ async function loadTodayRecords() {
         const result = await response.json();
 
         if (result.success) {
-            displayRecords(result.data, result.count);
+            displayRecords(toRecords(result.columns, result.data), result.count);
         } else {
             alert('加载失败: ' + result.message);
         }
@@ -24,7 +24,7 @@ async function loadRecentRecords() {
         const result = await response.json();
 
         if (result.success) {
-            displayRecords(result.data, result.count);
+            displayRecords(toRecords(result.columns, result.data), result.count);
         } else {
             alert('加载失败: ' + result.message);
         }
@@ -34,6 +34,15 @@ async function loadRecentRecords() {
     }
 }
 
+// 按列格式（columns + 数组行）还原为记录对象
+function toRecords(columns, rows) {
+    return rows.map(row => {
+        const record = {};
+        columns.forEach((column, i) => { record[column] = row[i]; });
+        return record;
+    });
+}
+
 // 显示记录
 function displayRecords(records, count) {
     const container = document.getElementById('records-container');
@@ -62,9 +71,11 @@ function displayRecords(records, count) {
 
                 ${imagePath ? `
                     <div class="record-image">
-                        <img src="/image?path=${encodeURIComponent(imagePath)}"
+                        <img src="/image?path=${encodeURIComponent(imagePath)}&thumb=1"
                              alt="检测图片"
-                             onclick="window.open(this.src)"
+                             loading="lazy"
+                             data-full="/image?path=${encodeURIComponent(imagePath)}"
+                             onclick="window.open(this.dataset.full)"
                              onerror="this.parentElement.innerHTML='<p class=\\'text-muted\\'>图片不可用</p>'">
                     </div>
                 ` : ''}